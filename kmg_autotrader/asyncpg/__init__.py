@@ -1,5 +1,22 @@
 import asyncio
 
+class PostgresError(Exception):
+    pass
+
+class _Transaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+class PreparedStatement:
+    async def executemany(self, *args, **kwargs):
+        return None
+
+    async def fetch(self, *args, **kwargs):
+        return []
+
 class Connection:
     async def execute(self, *args, **kwargs):
         return None
@@ -7,8 +24,49 @@ class Connection:
     async def executemany(self, *args, **kwargs):
         return None
 
+    async def fetchval(self, *args, **kwargs):
+        return None
+
+    async def prepare(self, *args, **kwargs):
+        return PreparedStatement()
+
+    async def copy_records_to_table(self, *args, **kwargs):
+        return None
+
+    def transaction(self):
+        return _Transaction()
+
     async def close(self):
         return None
 
 async def connect(*args, **kwargs):
     return Connection()
+
+class _Acquire:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+class Pool:
+    def __init__(self):
+        self._conn = Connection()
+
+    def acquire(self):
+        return _Acquire(self._conn)
+
+    async def execute(self, *args, **kwargs):
+        return await self._conn.execute(*args, **kwargs)
+
+    async def fetchval(self, *args, **kwargs):
+        return await self._conn.fetchval(*args, **kwargs)
+
+    async def close(self):
+        return None
+
+async def create_pool(*args, **kwargs):
+    return Pool()
@@ -8,6 +8,13 @@ class AsyncClient:
     async def get_historical_klines(self, *args, **kwargs):
         return []
 
+    async def get_historical_klines_generator(self, *args, **kwargs):
+        return self._klines_generator()
+
+    async def _klines_generator(self):
+        return
+        yield
+
     async def close_connection(self):
         return None
 
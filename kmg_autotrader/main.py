@@ -8,6 +8,11 @@ import os
 
 import uvicorn
 
+try:  # uvloop is optional and unavailable on Windows
+    import uvloop
+except ImportError:  # pragma: no cover - fallback to the stock asyncio loop
+    uvloop = None  # type: ignore
+
 from src.analysis import ml_trainer, performance_analyzer
 from src.collector.binance_data_collector import BinanceDataCollector
 from src.executor.executor import Executor
@@ -23,8 +28,7 @@ async def main() -> None:
 
     logging.basicConfig(level=logging.INFO)
 
-    # Database initialization happens on module import
-    _ = performance_analyzer.SessionLocal
+    performance_analyzer.init_db()
 
     collector = BinanceDataCollector()
 
@@ -52,17 +56,25 @@ async def main() -> None:
     scheduler.start()
 
     server = uvicorn.Server(
-        uvicorn.Config(app=app, host="0.0.0.0", port=8000, loop="asyncio")
+        uvicorn.Config(
+            app=app,
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop" if uvloop is not None else "asyncio",
+        )
     )
 
-    collector_task = asyncio.create_task(collector.collect())
-    server_task = asyncio.create_task(server.serve())
-
     try:
-        await asyncio.gather(server_task, collector_task)
+        # TaskGroup cancels the sibling task if either one fails
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(collector.collect())
+            tg.create_task(server.serve())
     finally:
         scheduler.stop()
+        executor.close()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
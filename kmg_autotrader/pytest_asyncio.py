@@ -4,6 +4,10 @@ import inspect
 def pytest_pyfunc_call(pyfuncitem):
     marker = pyfuncitem.get_closest_marker("asyncio")
     if marker is not None and inspect.iscoroutinefunction(pyfuncitem.obj):
-        asyncio.run(pyfuncitem.obj(**pyfuncitem.funcargs))
+        # Like pytest itself, pass only the fixtures the test asks for, not
+        # autouse ones it does not name
+        argnames = pyfuncitem._fixtureinfo.argnames
+        kwargs = {name: pyfuncitem.funcargs[name] for name in argnames}
+        asyncio.run(pyfuncitem.obj(**kwargs))
         return True
     return None
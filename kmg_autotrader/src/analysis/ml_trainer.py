@@ -9,9 +9,13 @@ approval is not available.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import operator
 import sqlite3
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from itertools import accumulate
 from pathlib import Path
 from typing import Iterable, Tuple
 
@@ -30,70 +34,138 @@ class SimpleModel:
     lose_mean: list[float]
 
     def fit(self, X: list[list[float]], y: list[int]) -> None:
-        wins = [x for x, lbl in zip(X, y) if lbl == 1]
-        losses = [x for x, lbl in zip(X, y) if lbl == 0]
         n_features = len(X[0]) if X else 0
-        self.win_mean = [sum(vals) / len(wins) for vals in zip(*wins)] if wins else [0.0] * n_features
-        self.lose_mean = [sum(vals) / len(losses) for vals in zip(*losses)] if losses else [0.0] * n_features
+        win_sum = [0.0] * n_features
+        lose_sum = [0.0] * n_features
+        n_win = n_lose = 0
+        for x, lbl in zip(X, y):
+            if lbl == 1:
+                win_sum = [acc + xi for acc, xi in zip(win_sum, x)]
+                n_win += 1
+            elif lbl == 0:
+                lose_sum = [acc + xi for acc, xi in zip(lose_sum, x)]
+                n_lose += 1
+        self.win_mean = [v / n_win for v in win_sum] if n_win else win_sum
+        self.lose_mean = [v / n_lose for v in lose_sum] if n_lose else lose_sum
 
     def predict(self, X: list[list[float]]) -> list[int]:
-        preds = []
-        for x in X:
-            dist_win = sum((xi - wi) ** 2 for xi, wi in zip(x, self.win_mean))
-            dist_loss = sum((xi - li) ** 2 for xi, li in zip(x, self.lose_mean))
-            preds.append(1 if dist_win <= dist_loss else 0)
-        return preds
+        # |x - w|^2 <= |x - l|^2  <=>  x . (w - l) >= (|w|^2 - |l|^2) / 2,
+        # so each sample needs a single dot product against fixed weights.
+        weights = [wi - li for wi, li in zip(self.win_mean, self.lose_mean)]
+        bias = (
+            sum(wi * wi for wi in self.win_mean)
+            - sum(li * li for li in self.lose_mean)
+        ) / 2
+        return [
+            1 if sum(map(operator.mul, x, weights)) >= bias else 0 for x in X
+        ]
+
 
 # Paths ---------------------------------------------------------------------
 
+BASE_PATH = Path(__file__).resolve().parents[2] / "project_metadata"
+
 # Database with trade history. ``gpt_log_archive.db`` is used as a lightweight
 # store for various logs in this simplified code base, so we reuse it for
 # ``trade_log`` as well.
-DB_PATH = (
-    Path(__file__).resolve().parents[2] / "project_metadata" / "gpt_log_archive.db"
-)
+DB_PATH = BASE_PATH / "gpt_log_archive.db"
 
 # Where the trained model will be persisted.
-MODEL_PATH = (
-    Path(__file__).resolve().parents[2]
-    / "project_metadata"
-    / "MLModels"
-    / "model_v1.pkl"
-)
+MODEL_PATH = BASE_PATH / "MLModels" / "model_v1.pkl"
 
 
 # Data containers -----------------------------------------------------------
 
-@dataclass
-class TradeLog:
-    """Single trade record loaded from the database."""
+_FETCH_SIZE = 10_000
 
-    entry_price: float
-    exit_price: float
-    entry_time: int
-    exit_time: int
-    volume: float
+# Read-optimised settings for the hourly training job. These only affect this
+# connection; the journal mode is left to the writer (the executor).
+_READ_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
 
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
 
-def _load_trades() -> list[TradeLog]:
+
+@dataclass
+class TradeLog:
+    """Trade records loaded from the database, stored column-wise.
+
+    Each column is a typed :class:`array.array` so large histories are kept as
+    packed machine values instead of one Python object per trade.
+    """
+
+    entry_price: array = field(default_factory=lambda: array("d"))
+    exit_price: array = field(default_factory=lambda: array("d"))
+    entry_time: array = field(default_factory=lambda: array("d"))
+    exit_time: array = field(default_factory=lambda: array("d"))
+    volume: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.entry_price)
+
+    def digest(self) -> str:
+        """Return a content hash of all columns, used to detect new data."""
+
+        h = hashlib.blake2b(digest_size=16)
+        for column in (
+            self.entry_price,
+            self.exit_price,
+            self.entry_time,
+            self.exit_time,
+            self.volume,
+        ):
+            h.update(column.tobytes())
+        return h.hexdigest()
+
+    def extend(self, rows: list[tuple]) -> None:
+        """Append a chunk of ``(entry, exit, entry_time, exit_time, volume)`` rows."""
+
+        entry, exit_, entry_t, exit_t, vol = zip(*rows)
+        self.entry_price.extend(entry)
+        self.exit_price.extend(exit_)
+        self.entry_time.extend(entry_t)
+        self.exit_time.extend(exit_t)
+        self.volume.extend(vol)
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the cached connection to :data:`DB_PATH`, reopening if it moved."""
+
+    global _conn, _conn_path
+    if _conn is not None and _conn_path == DB_PATH:
+        return _conn
+    if _conn is not None:
+        _conn.close()
+    _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    for pragma in _READ_PRAGMAS:
+        _conn.execute(pragma)
+    _conn_path = DB_PATH
+    return _conn
+
+
+def _load_trades() -> TradeLog:
     """Load all trades from the SQLite ``trade_log`` table."""
 
+    trades = TradeLog()
     if not DB_PATH.exists():
         logging.warning("Trade DB %s does not exist", DB_PATH)
-        return []
+        return trades
 
-    conn = sqlite3.connect(DB_PATH)
     try:
-        rows = conn.execute(
+        cur = _get_conn().execute(
             "SELECT entry_price, exit_price, entry_time, exit_time, volume FROM trade_log"
-        ).fetchall()
+        )
+        cur.arraysize = _FETCH_SIZE
+        while chunk := cur.fetchmany():
+            trades.extend(chunk)
     except sqlite3.DatabaseError as exc:
         logging.error("Failed loading trades: %s", exc)
-        return []
-    finally:
-        conn.close()
+        return TradeLog()
 
-    trades = [TradeLog(*r) for r in rows]
     logging.info("Loaded %d trades from DB", len(trades))
     return trades
 
@@ -101,70 +173,71 @@ def _load_trades() -> list[TradeLog]:
 def _ema(values: Iterable[float], period: int = 14) -> list[float]:
     """Return Exponential Moving Average for the provided sequence."""
 
-    values = list(values)
-    if not values:
-        return []
-
     k = 2 / (period + 1)
-    ema: list[float] = [values[0]]
-    for val in values[1:]:
-        ema.append(val * k + ema[-1] * (1 - k))
-    return ema
+    decay = 1 - k
+    return list(accumulate(values, lambda prev, val: val * k + prev * decay))
 
 
 def _rsi(values: Iterable[float], period: int = 14) -> list[float]:
-    """Calculate a very simple Relative Strength Index."""
-
-    values = list(values)
-    if len(values) < 2:
-        return [50.0 for _ in values]  # Neutral RSI if insufficient data
-
-    deltas = [values[i] - values[i - 1] for i in range(1, len(values))]
-
-    def calc_at(idx: int) -> float:
-        start = max(0, idx - period + 1)
-        gains = [max(d, 0.0) for d in deltas[start:idx + 1]]
-        losses = [-min(d, 0.0) for d in deltas[start:idx + 1]]
-        avg_gain = sum(gains) / period if gains else 0.0
-        avg_loss = sum(losses) / period if losses else 0.0
+    """Calculate the Relative Strength Index using Wilder's smoothing.
+
+    The first ``period`` deltas seed simple averages; afterwards each average
+    is updated with ``avg = (avg * (period - 1) + x) / period``, so the series
+    is produced in one streaming pass with constant state.
+    """
+
+    rsi: list[float] = []
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev = 0.0
+    for idx, value in enumerate(values):
+        if idx == 0:
+            rsi.append(50.0)  # Neutral RSI if insufficient data
+            prev = value
+            continue
+        delta = value - prev
+        prev = value
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if idx <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
         if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        return 100 - 100 / (1 + rs)
-
-    rsi = [50.0]
-    for i in range(1, len(values)):
-        rsi.append(calc_at(i - 1))
+            rsi.append(100.0)
+        else:
+            rsi.append(100 - 100 / (1 + avg_gain / avg_loss))
     return rsi
 
 
-def _build_features(trades: list[TradeLog]) -> Tuple[list[list[float]], list[int]]:
+def _build_features(trades: TradeLog) -> Tuple[list[list[float]], list[int]]:
     """Transform raw trades into ML-ready features and labels."""
 
     if not trades:
         return [], []
 
-    exit_prices = [t.exit_price for t in trades]
-    ema_series = _ema(exit_prices)
-    rsi_series = _rsi(exit_prices)
+    ema_series = _ema(trades.exit_price)
+    rsi_series = _rsi(trades.exit_price)
 
     features: list[list[float]] = []
     labels: list[int] = []
 
-    for idx, trade in enumerate(trades):
-        duration = trade.exit_time - trade.entry_time
-        pnl = trade.exit_price - trade.entry_price
+    for entry, exit_, entry_t, exit_t, volume, rsi, ema in zip(
+        trades.entry_price,
+        trades.exit_price,
+        trades.entry_time,
+        trades.exit_time,
+        trades.volume,
+        rsi_series,
+        ema_series,
+    ):
+        duration = exit_t - entry_t
+        pnl = exit_ - entry
         speed = pnl / duration if duration else pnl
 
-        feat = [
-            trade.entry_price,
-            trade.exit_price,
-            speed,
-            rsi_series[idx],
-            ema_series[idx],
-            trade.volume,
-        ]
-        features.append(feat)
+        features.append([entry, exit_, speed, rsi, ema, volume])
         labels.append(1 if pnl > 0 else 0)
 
     return features, labels
@@ -178,13 +251,24 @@ def train() -> None:
         logging.warning("No trades available for training")
         return
 
+    digest = trades.digest()
+    digest_path = MODEL_PATH.with_suffix(".digest")
+    if (
+        MODEL_PATH.exists()
+        and digest_path.exists()
+        and digest_path.read_text() == digest
+    ):
+        logging.info("Trades unchanged since last training; skipping")
+        return
+
     X, y = _build_features(trades)
 
     clf = SimpleModel()
     clf.fit(X, y)
     MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
     with MODEL_PATH.open("wb") as f:
-        pickle.dump(clf, f)
+        pickle.dump(clf, f, protocol=pickle.HIGHEST_PROTOCOL)
+    digest_path.write_text(digest)
     logging.info("Model trained and saved to %s", MODEL_PATH)
 
 
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any, Dict
 
 try:  # python-dotenv might not be available in minimal environments
@@ -42,6 +46,26 @@ except Exception:  # pragma: no cover - fallback if library missing
 
 load_dotenv()
 
+_asset_free = itemgetter("asset", "free")
+# Balances rarely change between back-to-back risk checks.
+BALANCE_TTL = 1.0  # seconds
+
+# python-binance keeps a requests.Session per Client; sharing one Client per
+# credential pair lets short-lived wrappers reuse its keep-alive connections.
+_clients: Dict[tuple[str, str], Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _shared_client(api_key: str, api_secret: str) -> Client:
+    key = (api_key, api_secret)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = Client(api_key, api_secret)
+    return client
+
 
 def _get_env(key: str) -> str:
     value = os.getenv(key)
@@ -62,7 +86,9 @@ class BinanceClient:
             self.api_key = _get_env("BINANCE_API_KEY")
         if self.api_secret is None:
             self.api_secret = _get_env("BINANCE_SECRET_KEY")
-        self._client = Client(self.api_key, self.api_secret)
+        self._client = _shared_client(self.api_key, self.api_secret)
+        self._balance: Dict[str, float] = {}
+        self._balance_expires = 0.0
         logging.debug("BinanceClient initialized")
 
     # ------------------------------------------------------------------
@@ -81,7 +107,8 @@ class BinanceClient:
         }
         if price:
             params["price"] = price
-        logging.debug("Sending order to Binance: %s", params)
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug("Sending order to Binance: %s", params)
         return self._client.create_order(**params)
 
     def get_position(self, symbol: str) -> float:
@@ -95,10 +122,18 @@ class BinanceClient:
             return 0.0
 
     def get_balance(self) -> Dict[str, float]:
-        """Return account balances as a mapping."""
+        """Return account balances as a mapping, cached for :data:`BALANCE_TTL`."""
+        now = time.monotonic()
+        if now < self._balance_expires:
+            return dict(self._balance)
         try:
             account = self._client.get_account()
-            return {b["asset"]: float(b["free"]) for b in account.get("balances", [])}
+            self._balance = {
+                asset: float(free)
+                for asset, free in map(_asset_free, account.get("balances", ()))
+            }
+            self._balance_expires = now + BALANCE_TTL
+            return dict(self._balance)
         except BinanceAPIException as exc:  # pragma: no cover
             logging.error("Failed to fetch balance: %s", exc)
             return {}
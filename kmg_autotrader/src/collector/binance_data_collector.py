@@ -5,12 +5,50 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from collections import deque
+from contextlib import suppress
 from dataclasses import dataclass
-from typing import Any, Iterable
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Iterable, Iterator
 
 import asyncpg
 from binance import AsyncClient, BinanceSocketManager
 
+_COLUMNS = ["open_time", "open", "high", "low", "close", "volume", "close_time"]
+
+# Historical klines are inserted in chunks of this many rows per statement.
+BULK_CHUNK = 10_000
+_INSERT_UNNEST = """
+    INSERT INTO market_data(open_time, open, high, low, close, volume, close_time)
+    SELECT * FROM unnest(
+        $1::bigint[], $2::float8[], $3::float8[], $4::float8[],
+        $5::float8[], $6::float8[], $7::bigint[]
+    )
+    ON CONFLICT (open_time) DO NOTHING
+"""
+# Newest candle written by the REST backfill. The websocket also writes to
+# market_data, so max(open_time) there says nothing about gaps in history.
+_MARK_BACKFILLED = """
+    INSERT INTO market_data_backfill(symbol, last_open_time) VALUES ($1, $2)
+    ON CONFLICT (symbol) DO UPDATE SET last_open_time = EXCLUDED.last_open_time
+"""
+
+# Live candles are buffered and written with COPY when FLUSH_SIZE is reached
+# or, from a timer, every FLUSH_INTERVAL. Binance pushes a kline update roughly
+# every two seconds, so the interval has to span several of them to batch.
+FLUSH_SIZE = 500
+FLUSH_INTERVAL = 10.0  # seconds
+# Candles kept for retry while the database is unreachable (~a week of 1m
+# candles at one update per two seconds); the oldest are dropped beyond it.
+MAX_BUFFERED = 300_000
+
+# REST klines carry [open_time, o, h, l, c, v, close_time, ...extra fields].
+_kline_row = itemgetter(0, 1, 2, 3, 4, 5, 6)
+# Raw kline payload fields in _COLUMNS order, fetched in a single C call.
+_kline = itemgetter("k")
+_kline_fields = itemgetter("t", "o", "h", "l", "c", "v", "T")
+
 
 @dataclass
 class Candle:
@@ -34,12 +72,34 @@ class BinanceDataCollector:
         self._interval = interval
         self._db_url = os.getenv("POSTGRES_URL")
         self._client: AsyncClient | None = None
-        self._conn: asyncpg.Connection | None = None
+        self._pool: asyncpg.Pool | None = None
+        self._buf: deque[tuple] = deque(maxlen=MAX_BUFFERED)
+
+    @staticmethod
+    async def _init_conn(conn: asyncpg.Connection) -> None:
+        """Prepare each pooled connection with its own staging table."""
+        # Session-scoped staging table: COPY cannot resolve conflicts itself.
+        # Rows are dropped at commit, so no TRUNCATE round-trip per flush.
+        await conn.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS market_data_stage (
+                open_time BIGINT,
+                open DOUBLE PRECISION,
+                high DOUBLE PRECISION,
+                low DOUBLE PRECISION,
+                close DOUBLE PRECISION,
+                volume DOUBLE PRECISION,
+                close_time BIGINT
+            ) ON COMMIT DELETE ROWS
+            """
+        )
 
     async def _connect(self) -> None:
         self._client = await AsyncClient.create()
-        self._conn = await asyncpg.connect(self._db_url)
-        await self._conn.execute(
+        self._pool = await asyncpg.create_pool(
+            self._db_url, min_size=2, max_size=8, init=self._init_conn
+        )
+        await self._pool.execute(
             """
             CREATE TABLE IF NOT EXISTS market_data (
                 open_time BIGINT PRIMARY KEY,
@@ -52,67 +112,148 @@ class BinanceDataCollector:
             )
             """
         )
+        await self._pool.execute(
+            """
+            CREATE TABLE IF NOT EXISTS market_data_backfill (
+                symbol TEXT PRIMARY KEY,
+                last_open_time BIGINT NOT NULL
+            )
+            """
+        )
 
     async def _fetch_historical(self) -> None:
         assert self._client
-        logging.info("Fetching historical data for %s", self._symbol)
-        klines = await self._client.get_historical_klines(
+        assert self._pool
+        # Resume after the newest backfilled candle so restarts do not re-send
+        # a year of rows that would only hit ON CONFLICT
+        last = await self._pool.fetchval(
+            "SELECT last_open_time FROM market_data_backfill WHERE symbol = $1",
             self._symbol,
-            self._interval,
-            "1 year ago UTC",
         )
+        start: int | str = last + 1 if last is not None else "1 year ago UTC"
+        logging.info("Fetching historical data for %s from %s", self._symbol, start)
+        # Insert each chunk as soon as it is downloaded, overlapping network and
+        # database work instead of holding the whole year in memory first
+        batch: list[list[Any]] = []
+        # AsyncClient returns the async generator from a coroutine
+        async for kline in await self._client.get_historical_klines_generator(
+            self._symbol,
+            self._interval,
+            start,
+        ):
+            batch.append(kline)
+            if len(batch) >= BULK_CHUNK:
+                await self._store_history(batch)
+                batch = []
+        if batch:
+            await self._store_history(batch)
+
+    async def _store_history(self, klines: list[list[Any]]) -> None:
+        """Insert a backfill batch, then advance the resume point past it."""
+        assert self._pool
         await self._bulk_insert(klines)
+        await self._pool.execute(_MARK_BACKFILLED, self._symbol, int(klines[-1][0]))
+
+    @staticmethod
+    def _column_chunks(klines: Iterable[list[Any]]) -> Iterator[tuple[list, ...]]:
+        """Yield ``_INSERT_UNNEST`` arguments, one column-array tuple per chunk."""
+        rows = map(_kline_row, klines)
+        while chunk := list(islice(rows, BULK_CHUNK)):
+            # Transpose once, then convert whole columns with C-level map()
+            t, o, h, l, c, v, ct = zip(*chunk)
+            yield (
+                list(map(int, t)),
+                list(map(float, o)),
+                list(map(float, h)),
+                list(map(float, l)),
+                list(map(float, c)),
+                list(map(float, v)),
+                list(map(int, ct)),
+            )
 
     async def _bulk_insert(self, klines: Iterable[list[Any]]) -> None:
-        assert self._conn
+        assert self._pool
+        async with self._pool.acquire() as conn:
+            # asyncpg's per-connection statement cache parses _INSERT_UNNEST
+            # once; executemany pipelines every chunk through that statement
+            await conn.executemany(_INSERT_UNNEST, self._column_chunks(klines))
+
+    async def _flush(self) -> None:
+        """Write buffered live candles via COPY into the staging table."""
+        if not self._buf:
+            return
+        assert self._pool
+        raw, self._buf = self._buf, deque(maxlen=MAX_BUFFERED)
+        # Conversion happens per batch so the receive loop only slices fields
         records = [
-            (
-                int(k[0]),
-                float(k[1]),
-                float(k[2]),
-                float(k[3]),
-                float(k[4]),
-                float(k[5]),
-                int(k[6]),
-            )
-            for k in klines
+            (int(t), float(o), float(h), float(l), float(c), float(v), int(ct))
+            for t, o, h, l, c, v, ct in raw
         ]
-        await self._conn.executemany(
-            """
-            INSERT INTO market_data(open_time, open, high, low, close, volume, close_time)
-            VALUES($1, $2, $3, $4, $5, $6, $7)
-            ON CONFLICT (open_time) DO NOTHING
-            """,
-            records,
-        )
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
+                await conn.copy_records_to_table(
+                    "market_data_stage", records=records, columns=_COLUMNS
+                )
+                await conn.execute(
+                    """
+                    INSERT INTO market_data SELECT * FROM market_data_stage
+                    ON CONFLICT (open_time) DO NOTHING
+                    """
+                )
+        except asyncpg.PostgresError as exc:
+            # Keep the candles, ahead of anything received meanwhile, so the
+            # next flush retries them instead of losing market data
+            self._requeue(raw)
+            logging.error("Failed to flush %d candles: %s", len(records), exc)
+        except BaseException:
+            # e.g. the timer task cancelled mid-flush; ON CONFLICT makes a
+            # retry of rows that did commit harmless
+            self._requeue(raw)
+            raise
+
+    def _requeue(self, raw: Iterable[tuple]) -> None:
+        """Put unflushed candles back ahead of anything received meanwhile."""
+        pending = [*raw, *self._buf]
+        dropped = len(pending) - MAX_BUFFERED
+        if dropped > 0:
+            logging.warning("Candle buffer full; dropping %d oldest candles", dropped)
+        self._buf = deque(pending, maxlen=MAX_BUFFERED)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            await self._flush()
 
     async def _start_ws(self) -> None:
         assert self._client
-        assert self._conn
+        assert self._pool
         logging.info("Starting websocket stream for %s", self._symbol)
         bm = BinanceSocketManager(self._client)
-        async with bm.kline_socket(self._symbol, interval=self._interval) as stream:
-            async for message in stream:
-                data = message["k"]
-                candle = (
-                    int(data["t"]),
-                    float(data["o"]),
-                    float(data["h"]),
-                    float(data["l"]),
-                    float(data["c"]),
-                    float(data["v"]),
-                    int(data["T"]),
-                )
-                await self._bulk_insert([candle])
+        flusher = asyncio.create_task(self._flush_periodically())
+        try:
+            async with bm.kline_socket(self._symbol, interval=self._interval) as stream:
+                async for message in stream:
+                    self._buf.append(_kline_fields(_kline(message)))
+                    if len(self._buf) >= FLUSH_SIZE:
+                        await self._flush()
+        finally:
+            flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await flusher
+            await self._flush()
 
     async def collect(self) -> None:
         """Collect historical and real-time data then close connections."""
         await self._connect()
         try:
-            await self._fetch_historical()
-            await self._start_ws()
+            # Stream live candles while the backfill runs on its own connection;
+            # the TaskGroup cancels the sibling if either fails, so nothing is
+            # left running on the client and pool closed below
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._fetch_historical())
+                tg.create_task(self._start_ws())
         finally:
             if self._client:
                 await self._client.close_connection()
-            if self._conn:
-                await self._conn.close()
+            if self._pool:
+                await self._pool.close()
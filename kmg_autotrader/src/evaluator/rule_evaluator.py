@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import logging
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Signal:
     """Trading signal generated by rule evaluator."""
 
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import random
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from itertools import count
 from pathlib import Path
 
 try:  # python-dotenv may not be installed during tests
@@ -18,10 +21,45 @@ except Exception:  # pragma: no cover - fallback
 
 from src.binance_client import BinanceClient, BinanceAPIException
 from src.trigger.gpt_controller import GPTController, GPTResponse
-from src.webui.alerts.telegram_bot import send_alert
 
 load_dotenv()
 
+DB_PATH = Path(__file__).resolve().parents[2] / "project_metadata" / "trade_log.db"
+
+_LOG_SQL = (
+    "INSERT INTO TradeLog(ts_ms, symbol, side, quantity, price, status) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+# Errors retried for order placement: rate limit (-1003, HTTP 429) and clock
+# skew (-1021), both rejected before the order is processed. Timeouts (-1007)
+# and 5xx responses are not retried: the order may already have been accepted
+# and resubmitting it could fill twice.
+_RETRYABLE_CODES = frozenset({-1003, -1021})
+_RETRYABLE_STATUS = frozenset({429})
+
+# An identical prompt within the same minute is treated as a duplicate: GPT is
+# not asked again and the signal is not executed a second time.
+SIGNAL_BUCKET = 60  # seconds
+
+# Deferred (rejected-signal) log rows are committed within this long.
+COMMIT_INTERVAL = 0.5  # seconds
+
+
+def send_alert(message: str) -> None:
+    """Forward ``message`` to Telegram, importing the bot module on first use."""
+    global send_alert
+    from src.webui.alerts.telegram_bot import send_alert as _send
+
+    send_alert = _send
+    _send(message)
+
 
 @dataclass
 class Order:
@@ -49,19 +87,15 @@ class Executor:
         self._position_limit = (
             position_limit if position_limit is not None else float(os.getenv("POSITION_LIMIT_PERCENT", "0.2"))
         )
-        path = (
-            Path(db_path)
-            if db_path
-            else Path(__file__).resolve().parents[2]
-            / "project_metadata"
-            / "trade_log.db"
-        )
-        self._conn = sqlite3.connect(path)
+        path = Path(db_path) if db_path else DB_PATH
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS TradeLog(
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
+                ts_ms INTEGER,
                 symbol TEXT,
                 side TEXT,
                 quantity REAL,
@@ -70,36 +104,127 @@ class Executor:
             )
             """
         )
+        # Logs created before ts_ms keep their ISO ``timestamp`` column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(TradeLog)")}
+        if "ts_ms" not in columns:
+            self._conn.execute("ALTER TABLE TradeLog ADD COLUMN ts_ms INTEGER")
         self._conn.commit()
-        self._retry_timeout = 5.0
+        self._last_commit = time.monotonic()
+        # Serializes the connection between callers and the deferred-commit
+        # timer thread
+        self._db_lock = threading.Lock()
+        self._commit_timer: threading.Timer | None = None
+        self._closed = False
+        self._max_attempts = 6
+        # (prompt digest, bucket) of prompts already signalled this bucket
+        self._seen_prompts: set[tuple[bytes, int]] = set()
         logging.debug("Executor initialized with limit %.2f", self._position_limit)
 
     # ------------------------------------------------------------------
     def _log_trade(
-        self, symbol: str, side: str, qty: float, price: float, status: str
+        self,
+        symbol: str,
+        side: str,
+        qty: float,
+        price: float,
+        status: str,
+        defer: bool = False,
     ) -> None:
-        self._conn.execute(
-            "INSERT INTO TradeLog(timestamp, symbol, side, quantity, price, status) VALUES (?, ?, ?, ?, ?, ?)",
-            (datetime.utcnow().isoformat(), symbol, side, qty, price, status),
-        )
-        self._conn.commit()
+        """Insert a TradeLog row stamped with epoch milliseconds (``ts_ms``).
+
+        With ``defer`` the commit is skipped unless :data:`COMMIT_INTERVAL`
+        has elapsed, so bursts of rejections share one fsync. A timer then
+        commits the pending rows at most :data:`COMMIT_INTERVAL` later.
+        """
+        with self._db_lock:
+            self._conn.execute(
+                _LOG_SQL,
+                (time.time_ns() // 1_000_000, symbol, side, qty, price, status),
+            )
+            now = time.monotonic()
+            if not defer or now - self._last_commit >= COMMIT_INTERVAL:
+                self._conn.commit()
+                self._last_commit = now
+            elif self._commit_timer is None:
+                self._commit_timer = threading.Timer(
+                    COMMIT_INTERVAL, self._commit_deferred
+                )
+                self._commit_timer.daemon = True
+                self._commit_timer.start()
+
+    def _commit_deferred(self) -> None:
+        with self._db_lock:
+            # The timer may already be waiting on the lock when close() runs
+            if self._closed:
+                return
+            self._commit_timer = None
+            self._conn.commit()
+            self._last_commit = time.monotonic()
+
+    def close(self) -> None:
+        """Commit pending log rows and close the database connection."""
+        with self._db_lock:
+            if self._commit_timer is not None:
+                self._commit_timer.cancel()
+                self._commit_timer = None
+            self._conn.commit()
+            self._conn.close()
+            self._closed = True
+
+    @staticmethod
+    def _is_retryable(exc: BinanceAPIException) -> bool:
+        """Return ``True`` for transient errors such as rate limits."""
+        if getattr(exc, "code", None) in _RETRYABLE_CODES:
+            return True
+        return getattr(exc, "status_code", None) in _RETRYABLE_STATUS
+
+    def _retry_delay(self, attempt: int) -> float | None:
+        """Return the backoff before the next attempt, or ``None`` to give up."""
+        if attempt + 1 >= self._max_attempts:
+            return None
+        return min(0.1 * 2**attempt, 2.0) + random.uniform(0, 0.1)
 
     def _call_with_retry(self, func, *args, **kwargs):
-        end = time.time() + self._retry_timeout
-        while True:
+        for attempt in count():
             try:
                 return func(*args, **kwargs)
             except BinanceAPIException as exc:
-                if time.time() >= end:
-                    logging.error("Retries exhausted: %s", exc)
+                delay = self._retry_delay(attempt) if self._is_retryable(exc) else None
+                if delay is None:
+                    logging.error("Binance call failed: %s", exc)
                     raise
-                logging.warning("Binance error, retrying: %s", exc)
-                time.sleep(1)
+                logging.warning("Binance error, retrying in %.2fs: %s", delay, exc)
+                time.sleep(delay)
 
     # ------------------------------------------------------------------
+    def _get_signal(self, prompt: str) -> tuple[GPTResponse | None, bool]:
+        """Return ``(signal, duplicate)`` for ``prompt``.
+
+        Prompts are deduplicated, not cached: an identical prompt already
+        signalled within the current :data:`SIGNAL_BUCKET` is not sent to GPT
+        again and yields ``(None, True)``.
+        """
+        bucket = int(time.time() // SIGNAL_BUCKET)
+        key = (hashlib.blake2b(prompt.encode(), digest_size=16).digest(), bucket)
+        if key in self._seen_prompts:
+            return None, True
+        signal = self._gpt.send_prompt(prompt)
+        if signal is not None:
+            # Keys from earlier buckets can no longer match
+            self._seen_prompts = {k for k in self._seen_prompts if k[1] == bucket}
+            self._seen_prompts.add(key)
+        return signal, False
+
     def execute(self, prompt: str, symbol: str) -> bool:
         """Get GPT signal and place order if within limits."""
-        signal: GPTResponse | None = self._gpt.send_prompt(prompt)
+        signal, duplicate = self._get_signal(prompt)
+        if duplicate:
+            logging.info(
+                "Duplicate prompt for %s within %ds; not re-executing",
+                symbol,
+                SIGNAL_BUCKET,
+            )
+            return False
         if signal is None:
             logging.error("GPT returned no signal")
             send_alert("GPT error: no signal returned")
@@ -108,7 +233,9 @@ class Executor:
         current = self._client.get_position(symbol)
         if current + signal.size > self._position_limit:
             logging.warning("Position limit exceeded for %s", symbol)
-            self._log_trade(symbol, signal.direction, signal.size, 0.0, "rejected")
+            self._log_trade(
+                symbol, signal.direction, signal.size, 0.0, "rejected", defer=True
+            )
             send_alert("Signal rejected: position limit exceeded")
             return False
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 import pickle
@@ -12,7 +12,10 @@ from src.webui.alerts.telegram_bot import send_alert
 from src.analysis import performance_analyzer
 
 
-@dataclass
+RISK_MODES = frozenset({"normal", "conservative"})
+
+
+@dataclass(slots=True, frozen=True)
 class RiskParameters:
     max_position_percent: float
     max_drawdown: float
@@ -38,14 +41,15 @@ class RiskManager:
         self._current_drawdown = 0.0
         self._volume_factor = 1.0
         self._default_confidence = params.min_confidence
+        self._model: object | None = None
+        self._model_mtime = 0
 
     # ------------------------------------------------------------------
     def auto_adjust(self, trades: int, threshold: float) -> None:
         """Automatically switch risk mode based on recent drawdown."""
 
         recent = performance_analyzer.get_recent_trades(trades)
-        equity = performance_analyzer.pnl_equity(recent)
-        dd = performance_analyzer.max_drawdown(equity)
+        _, dd = performance_analyzer.equity_and_drawdown(recent)
         self._current_drawdown = dd
         if dd > threshold:
             self._set_conservative()
@@ -57,17 +61,24 @@ class RiskManager:
         if self._params.risk_mode == "conservative":
             return
         logging.warning("Switching to conservative risk mode")
-        self._params.risk_mode = "conservative"
+        # Swap in a new object so readers never see a half-applied mode
+        self._params = replace(
+            self._params,
+            risk_mode="conservative",
+            min_confidence=max(0.9, self._params.min_confidence),
+        )
         self._volume_factor = 0.5
-        self._params.min_confidence = max(0.9, self._params.min_confidence)
 
     def _set_normal(self) -> None:
         if self._params.risk_mode == "normal":
             return
         logging.info("Switching to normal risk mode")
-        self._params.risk_mode = "normal"
+        self._params = replace(
+            self._params,
+            risk_mode="normal",
+            min_confidence=self._default_confidence,
+        )
         self._volume_factor = 1.0
-        self._params.min_confidence = self._default_confidence
 
     # ------------------------------------------------------------------
     def scale_size(self, size: float) -> float:
@@ -75,6 +86,16 @@ class RiskManager:
 
         return size * self._volume_factor
 
+    def _get_model(self) -> object:
+        """Return the ML model, unpickling it only when the file changes."""
+
+        mtime = ML_MODEL_PATH.stat().st_mtime_ns
+        if self._model is None or mtime != self._model_mtime:
+            with ML_MODEL_PATH.open("rb") as f:
+                self._model = pickle.load(f)
+            self._model_mtime = mtime
+        return self._model
+
     def validate(
         self,
         size: float,
@@ -99,8 +120,7 @@ class RiskManager:
                 send_alert("Risk check failed: no features for model")
                 return False
             try:
-                with ML_MODEL_PATH.open("rb") as f:
-                    model = pickle.load(f)
+                model = self._get_model()
                 pred = int(model.predict([features])[0])
                 logging.info("ML model decision: %d", pred)
                 return bool(pred)
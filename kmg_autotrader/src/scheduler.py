@@ -3,11 +3,34 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import sched
 import threading
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Callable
 
+# Shared pool for CPU-bound jobs (model training, reports), created on demand.
+PROCESS_POOL: ProcessPoolExecutor | None = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global PROCESS_POOL
+    if PROCESS_POOL is None:
+        # Spawn rather than fork: forked workers would inherit the SQLAlchemy
+        # engine's pooled Postgres sockets and share their protocol state
+        PROCESS_POOL = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+    return PROCESS_POOL
+
+
+def _shutdown_process_pool() -> None:
+    global PROCESS_POOL
+    if PROCESS_POOL is not None:
+        PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+        PROCESS_POOL = None
+
 
 class Scheduler:
     """Manage periodic jobs using :mod:`sched`."""
@@ -18,31 +41,73 @@ class Scheduler:
         self._analyzer = performance_analyzer
         self._sched = sched.scheduler(time.time, time.sleep)
         self._stop = threading.Event()
+        # Set whenever the queue changes from another thread (pool callbacks)
+        # or on shutdown, so ``_run`` re-evaluates its next deadline.
+        self._wake = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
 
     # ------------------------------------------------------------------
-    def _wrap(self, func: Callable[[], None], interval: int) -> Callable[[], None]:
-        lock = threading.Lock()
+    def _wrap(
+        self, func: Callable[[], None], interval: int, offload: bool = False
+    ) -> Callable[[], None]:
+        """Return a non-reentrant job that reschedules itself every ``interval``.
+
+        With ``offload`` the function runs in :data:`PROCESS_POOL` so CPU-heavy
+        work does not hold up the jobs queued behind it on the scheduler thread.
+        """
+
+        # Jobs fire from the single scheduler thread, so a plain flag is enough
+        # to skip overlapping runs; offloaded jobs clear it from their callback.
+        running = False
+        name = getattr(func, "__name__", "func")
+
+        def finish(future: Future | None = None) -> None:
+            nonlocal running
+            if future is not None and future.exception() is not None:
+                logging.error("Job %s failed: %s", name, future.exception())
+            running = False
+            logging.info("Job %s finished", name)
+            self._sched.enter(interval, 1, job)
+            self._wake.set()
 
         def job() -> None:
-            if not lock.acquire(blocking=False):
-                logging.info("Job %s skipped: already running", getattr(func, "__name__", "func"))
+            nonlocal running
+            if running:
+                logging.info("Job %s skipped: already running", name)
                 self._sched.enter(interval, 1, job)
                 return
-            logging.info("Job %s started", getattr(func, "__name__", "func"))
+            running = True
+            logging.info("Job %s started", name)
+            # Errors are logged here rather than raised: an exception escaping
+            # into sched.run() would end the scheduler thread and every job
+            if offload:
+                try:
+                    future = _get_process_pool().submit(func)
+                except Exception:
+                    logging.exception("Job %s could not be submitted", name)
+                    finish()
+                    return
+                future.add_done_callback(finish)
+                return
             try:
                 func()
+            except Exception:
+                logging.exception("Job %s failed", name)
             finally:
-                lock.release()
-                logging.info("Job %s finished", getattr(func, "__name__", "func"))
-                self._sched.enter(interval, 1, job)
+                finish()
 
         return job
 
     def _setup_jobs(self) -> None:
         self._sched.enter(10, 1, self._wrap(self._trigger.check_new_signals, 10))
-        self._sched.enter(3600, 1, self._wrap(self._trainer.update_model, 3600))
-        self._sched.enter(86400, 1, self._wrap(self._analyzer.export_daily_report, 86400))
+        self._sched.enter(
+            3600, 1, self._wrap(self._trainer.update_model, 3600, offload=True)
+        )
+        self._sched.enter(
+            86400,
+            1,
+            self._wrap(self._analyzer.export_daily_report, 86400, offload=True),
+        )
 
     # ------------------------------------------------------------------
     def start(self) -> None:
@@ -54,15 +119,18 @@ class Scheduler:
 
     def _run(self) -> None:
         while not self._stop.is_set():
-            self._sched.run(blocking=False)
-            time.sleep(1)
+            self._wake.clear()
+            delay = self._sched.run(blocking=False)
+            self._wake.wait(60 if delay is None else delay)
 
     def stop(self) -> None:
         """Stop scheduler and wait for thread termination."""
 
         logging.info("Scheduler stopping")
         self._stop.set()
+        self._wake.set()
         self._thread.join(timeout=5)
+        _shutdown_process_pool()
         logging.info("Scheduler stopped")
 
 
@@ -1,15 +1,28 @@
 """Interact with OpenAI GPT models."""
 
+import asyncio
 import json
 import logging
 import os
 import sqlite3
+import threading
 import time
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 import openai
-from pydantic import BaseModel, ValidationError
+
+try:  # orjson is optional; stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - fallback
+    orjson = None  # type: ignore
+
+try:  # fastjsonschema compiles the response schema into plain Python
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fallback to the manual walker
+    fastjsonschema = None  # type: ignore
 
 from src.collector.binance_data_collector import Candle
 from src.evaluator.rule_evaluator import evaluate_rules
@@ -20,8 +33,38 @@ BASE_PATH = Path(__file__).resolve().parents[2] / "project_metadata"
 SCHEMA_PATH = BASE_PATH / "schema" / "gpt_response_schema.json"
 DB_PATH = BASE_PATH / "gpt_log_archive.db"
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except fits both
+_loads = orjson.loads if orjson is not None else json.loads
+_fmt_price = "{:.2f}".format
+_close = attrgetter("close")
+
+# JSON schema types checked by the fallback validator: (python types, label)
+_SCHEMA_TYPES = {"number": ((int, float), "number"), "string": ((str,), "string")}
+
+# One literal for every insert so sqlite3's statement cache reuses the plan
+_INSERT_LOG = (
+    "INSERT INTO gpt_logs(prompt, response, success, reason) VALUES (?, ?, ?, ?)"
+)
+
+# Parsed schema and its compiled validator, shared by every controller.
+_SCHEMA_CACHE: tuple[dict, Any] | None = None
+
+
+def _load_schema() -> tuple[dict, Any]:
+    """Return the response schema and its fastjsonschema validator (or None)."""
+
+    global _SCHEMA_CACHE
+    if _SCHEMA_CACHE is None:
+        schema = _loads(SCHEMA_PATH.read_bytes())
+        compiled = fastjsonschema.compile(schema) if fastjsonschema is not None else None
+        _SCHEMA_CACHE = (schema, compiled)
+    return _SCHEMA_CACHE
+
+
+@dataclass(slots=True, frozen=True)
+class GPTResponse:
+    """Trade proposal parsed from a schema-validated GPT reply."""
 
-class GPTResponse(BaseModel):
     direction: str
     size: float
     stop_loss: float
@@ -37,42 +80,87 @@ class GPTController:
 
         openai.api_key = api_key
         self._init_db()
-        with SCHEMA_PATH.open("r") as f:
-            self._schema = json.load(f)
-        self._last_error: str | None = None
+        self._schema, self._compiled = _load_schema()
+        # Fallback validator tables, resolved once instead of per response
+        self._required = tuple(self._schema.get("required", ()))
+        self._field_types = {
+            key: _SCHEMA_TYPES[prop["type"]]
+            for key, prop in self._schema.get("properties", {}).items()
+            if prop.get("type") in _SCHEMA_TYPES
+        }
 
     # ------------------------------------------------------------------
     def _validate_schema(self, data: dict) -> None:
         """Validate response dict against loaded JSON schema."""
 
-        for key in self._schema.get("required", []):
+        if self._compiled is not None:
+            try:
+                self._compiled(data)
+            except fastjsonschema.JsonSchemaValueException as exc:
+                raise ValueError(exc.message) from exc
+            return
+        for key in self._required:
             if key not in data:
                 raise ValueError(f"Missing required field: {key}")
-        for key, prop in self._schema.get("properties", {}).items():
-            if key not in data:
-                continue
-            t = prop.get("type")
-            if t == "number" and not isinstance(data[key], (int, float)):
-                raise ValueError(f"Field {key} must be a number")
-            if t == "string" and not isinstance(data[key], str):
-                raise ValueError(f"Field {key} must be a string")
+        for key, (types, label) in self._field_types.items():
+            if key in data and not isinstance(data[key], types):
+                raise ValueError(f"Field {key} must be a {label}")
 
     def _init_db(self) -> None:
-        """Create the log table if necessary."""
-
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS gpt_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ts TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    prompt TEXT,
-                    response TEXT,
-                    success INTEGER,
-                    reason TEXT
-                )
-                """
+        """Open the persistent log connection and create the table if needed."""
+
+        # Autocommit in WAL mode with synchronous=NORMAL: each log row is its
+        # own cheap transaction without an fsync per insert
+        self._conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute("PRAGMA cache_size=-8000")
+        self._db_lock = threading.Lock()
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS gpt_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                prompt TEXT,
+                response TEXT,
+                success INTEGER,
+                reason TEXT
             )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(gpt_logs)")}
+        if "reason" not in columns:
+            self._conn.execute("ALTER TABLE gpt_logs ADD COLUMN reason TEXT")
+
+    def log(self, prompt: str, response: str | None, success: int, reason: str) -> None:
+        """Append a row to ``gpt_logs`` over the shared connection."""
+
+        with self._db_lock:
+            self._conn.execute(_INSERT_LOG, (prompt, response, success, reason))
+
+    def log_many(self, rows: Iterable[tuple[str, str | None, int, str]]) -> None:
+        """Append several ``gpt_logs`` rows in a single transaction."""
+
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_INSERT_LOG, rows)
+            except sqlite3.DatabaseError:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the log database connection."""
+
+        with self._db_lock:
+            self._conn.close()
 
     def build_prompt(
         self,
@@ -82,7 +170,7 @@ class GPTController:
     ) -> str:
         """Construct a textual prompt for GPT from recent candles and risk."""
 
-        prices = ",".join(f"{c.close:.2f}" for c in candles)
+        prices = ",".join(map(_fmt_price, map(_close, candles)))
         prompt = (
             "Market closes: "
             f"[{prices}]\nCurrent position: {position}\n"
@@ -95,9 +183,19 @@ class GPTController:
     def send_prompt(self, prompt: str) -> GPTResponse | None:
         """Send a prompt to OpenAI and validate the structured response."""
 
+        return self._send(prompt)[0]
+
+    def _send(self, prompt: str) -> tuple[GPTResponse | None, str | None]:
+        """Return ``(response, error)`` for ``prompt``.
+
+        The error travels with the result rather than on the instance, since
+        concurrent :meth:`request_decision_async` calls share this controller.
+        """
+
         start = time.perf_counter()
         raw_response: str | None = None
         success = 0
+        error: str | None = None
         try:
             logging.info("Sending prompt to OpenAI")
             completion = openai.ChatCompletion.create(
@@ -106,39 +204,36 @@ class GPTController:
             )
             raw_response = completion.choices[0].message.content
             logging.debug("GPT raw response: %s", raw_response)
-            parsed = json.loads(raw_response)
+            parsed = _loads(raw_response)
             self._validate_schema(parsed)
-            response = GPTResponse(**parsed)
+            # _validate_schema already checked presence and types
+            response = GPTResponse(
+                direction=parsed["direction"],
+                size=float(parsed["size"]),
+                stop_loss=float(parsed["stop_loss"]),
+                take_profit=float(parsed["take_profit"]),
+                confidence=float(parsed["confidence"]),
+            )
             logging.info(
                 "GPT response validated with confidence %.2f in %.2fs",
                 response.confidence,
                 time.perf_counter() - start,
             )
             success = 1
-            self._last_error = None
-            return response
+            return response, None
         except (
             openai.error.OpenAIError,
             json.JSONDecodeError,
-            ValidationError,
+            KeyError,
             ValueError,
         ) as exc:
             logging.error("GPT error: %s", exc)
-            self._last_error = str(exc)
-            raw_response = raw_response or str(exc)
+            error = str(exc)
+            raw_response = raw_response or error
             send_alert(f"GPT error: {exc}")
-            return None
+            return None, error
         finally:
-            with sqlite3.connect(DB_PATH) as conn:
-                conn.execute(
-                    "INSERT INTO gpt_logs(prompt, response, success, reason) VALUES (?, ?, ?, ?)",
-                    (
-                        prompt,
-                        raw_response,
-                        success,
-                        self._last_error or "",
-                    ),
-                )
+            self.log(prompt, raw_response, success, error or "")
 
     def request_decision(
         self,
@@ -149,13 +244,25 @@ class GPTController:
         """Build prompt from context, send to GPT and return parsed response."""
 
         prompt = self.build_prompt(candles, position, risk)
-        response = self.send_prompt(prompt)
+        response, error = self._send(prompt)
         if response is None:
             logging.warning(
-                "Falling back to rule evaluator due to GPT failure: %s",
-                self._last_error,
+                "Falling back to rule evaluator due to GPT failure: %s", error
             )
             evaluate_rules([c.close for c in candles])
             return None
         return response
 
+    async def request_decision_async(
+        self,
+        candles: Iterable[Candle],
+        position: float,
+        risk: RiskParameters,
+    ) -> GPTResponse | None:
+        """Run :meth:`request_decision` in a worker thread.
+
+        The OpenAI client is blocking; offloading it keeps the event loop free
+        for the trigger's other tasks during the round-trip.
+        """
+
+        return await asyncio.to_thread(self.request_decision, candles, position, risk)
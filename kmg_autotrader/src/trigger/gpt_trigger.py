@@ -3,13 +3,22 @@
 import asyncio
 import logging
 import sqlite3
+import time
+from collections import deque
 from typing import Iterable, TYPE_CHECKING, Any
 
 from src.collector.binance_data_collector import Candle
 from src.evaluator.rule_evaluator import Signal
 from src.risk.risk_manager import RiskManager
 from src.webui.alerts.telegram_bot import send_alert
-from .gpt_controller import GPTController, DB_PATH
+from .gpt_controller import GPTController
+
+# Refusals are coalesced for LOG_LINGER seconds, up to LOG_BATCH rows per
+# transaction, by a background task on the running event loop.
+LOG_BATCH = 64
+LOG_LINGER = 0.1  # seconds
+
+_DIRECTIONS = frozenset(("BUY", "SELL"))
 
 if TYPE_CHECKING:  # pragma: no cover - only for typing
     from src.executor.executor import Executor, Order
@@ -44,38 +53,66 @@ class GPTTrigger:
         self._risk_manager = risk_manager
         self._executor = executor
         self._max_per_hour = max_per_hour
-        self._count = 0
-        self._lock = asyncio.Lock()
+        # Token bucket refilled continuously at max_per_hour tokens per hour
+        self._tokens = float(max_per_hour)
+        self._last_refill = time.monotonic()
+        self._log_queue: asyncio.Queue[tuple[str, str, int, str]] = asyncio.Queue()
+        self._log_writer: asyncio.Task[None] | None = None
 
-    def _log_refusal(self, reason: str) -> None:
-        """Record a refusal reason to the GPT log database."""
+    def _write_logs(self, rows: list[tuple[str, str, int, str]]) -> None:
         try:
-            with sqlite3.connect(DB_PATH) as conn:
-                conn.execute(
-                    "INSERT INTO gpt_logs(prompt, response, success, reason) VALUES (?, ?, ?, ?)",
-                    ("", "", 0, reason),
-                )
+            self._controller.log_many(rows)
         except sqlite3.DatabaseError as exc:  # pragma: no cover - log failure
-            logging.error("Failed to log GPT refusal: %s", exc)
+            logging.error("Failed to log %d GPT refusals: %s", len(rows), exc)
+
+    async def _flush_logs(self) -> None:
+        """Drain queued refusals into batched inserts until cancelled."""
+        rows: list[tuple[str, str, int, str]] = []
+        try:
+            while True:
+                rows.append(await self._log_queue.get())
+                await asyncio.sleep(LOG_LINGER)
+                while len(rows) < LOG_BATCH and not self._log_queue.empty():
+                    rows.append(self._log_queue.get_nowait())
+                self._write_logs(rows)
+                rows = []
+        finally:
+            # Cancelled on shutdown: persist whatever is still pending
+            while not self._log_queue.empty():
+                rows.append(self._log_queue.get_nowait())
+            if rows:
+                self._write_logs(rows)
+
+    def _log_refusal(self, reason: str) -> None:
+        """Queue a refusal reason for the GPT log database."""
+        row = ("", "", 0, reason)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # called outside the event loop: write directly
+            self._write_logs([row])
+            return
+        if self._log_writer is None or self._log_writer.done():
+            self._log_writer = loop.create_task(self._flush_logs())
+        self._log_queue.put_nowait(row)
 
     async def allow(self) -> bool:
         """Return ``True`` if a GPT call is permitted."""
-        async with self._lock:
-            if self._count >= self._max_per_hour:
-                logging.warning("GPT call blocked: limit reached")
-                send_alert("GPT limit reached: signal skipped")
-                self._log_refusal("limit reached")
-                return False
-            self._count += 1
-            logging.debug("GPT call allowed (%d/%d)", self._count, self._max_per_hour)
-            return True
-
-    async def reset(self) -> None:
-        """Reset counter every hour."""
-        while True:
-            await asyncio.sleep(3600)
-            async with self._lock:
-                self._count = 0
+        # No await between the check and the decrement, so the event loop
+        # cannot interleave another caller and no lock is needed here
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._max_per_hour),
+            self._tokens + (now - self._last_refill) * self._max_per_hour / 3600,
+        )
+        self._last_refill = now
+        if self._tokens < 1:
+            logging.warning("GPT call blocked: limit reached")
+            send_alert("GPT limit reached: signal skipped")
+            self._log_refusal("limit reached")
+            return False
+        self._tokens -= 1
+        logging.debug("GPT call allowed (%.1f tokens left)", self._tokens)
+        return True
 
     async def process(
         self,
@@ -85,21 +122,22 @@ class GPTTrigger:
     ) -> bool:
         """Validate the signal and, if allowed, execute GPT-driven order."""
 
-        if signal.direction not in {"BUY", "SELL"}:
+        params = self._risk_manager._params
+        if signal.direction not in _DIRECTIONS:
             logging.warning("Unsupported signal direction: %s", signal.direction)
             send_alert(f"Signal rejected: unsupported direction {signal.direction}")
             self._log_refusal("unsupported direction")
             return False
 
-        if self._risk_manager._params.risk_mode == "conservative":
+        if params.risk_mode == "conservative":
             logging.info("Conservative mode active - skipping GPT")
             self._log_refusal("conservative mode")
             return False
 
-        if signal.score < self._risk_manager._params.min_gpt_trigger_confidence:
+        if signal.score < params.min_gpt_trigger_confidence:
             reason = (
                 f"Rule score {signal.score:.2f} below threshold "
-                f"{self._risk_manager._params.min_gpt_trigger_confidence:.2f}"
+                f"{params.min_gpt_trigger_confidence:.2f}"
             )
             logging.info(reason)
             self._log_refusal(reason)
@@ -108,19 +146,21 @@ class GPTTrigger:
         if not await self.allow():
             return False
 
-        response = self._controller.request_decision(
-            list(candles)[-10:], position, self._risk_manager._params
+        response = await self._controller.request_decision_async(
+            deque(candles, maxlen=10), position, params
         )
         if response is None:
             send_alert("Signal rejected: GPT response invalid")
             self._log_refusal("invalid GPT response")
             return False
 
-        if response.confidence < self._risk_manager._params.min_confidence:
+        # Re-read: the risk mode may have been swapped during the round-trip
+        params = self._risk_manager._params
+        if response.confidence < params.min_confidence:
             logging.warning(
                 "GPT confidence %.2f below minimum %.2f",
                 response.confidence,
-                self._risk_manager._params.min_confidence,
+                params.min_confidence,
             )
             send_alert("Signal rejected: low confidence")
             self._log_refusal("low GPT confidence")
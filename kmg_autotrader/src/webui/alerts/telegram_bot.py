@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 try:  # requests may not be installed during tests
     import requests
@@ -14,7 +16,11 @@ except Exception:  # pragma: no cover - fallback
     requests = None  # type: ignore
 
 
-@dataclass
+# Telegram rejects sendMessage texts longer than this.
+MAX_MESSAGE_LEN = 4096
+
+
+@dataclass(slots=True)
 class TelegramBot:
     """Simple wrapper around the Telegram Bot API."""
 
@@ -22,6 +28,8 @@ class TelegramBot:
     chat_id: str
     delay: float = 2.0
     _last_sent: float = 0.0
+    # Keep-alive session so bursts of alerts reuse one TLS connection
+    _session: Any = field(default=None, repr=False)
 
     @property
     def api_url(self) -> str:
@@ -30,19 +38,16 @@ class TelegramBot:
         return f"https://api.telegram.org/bot{self.token}/sendMessage"
 
     def send_message(self, text: str) -> None:
-        """Send a message to the configured Telegram chat."""
-
-        now = time.monotonic()
-        if now - self._last_sent < self.delay:
-            logging.debug("Skipping Telegram message to avoid spam")
-            return
+        """Send a message to the configured Telegram chat right away."""
 
-        self._last_sent = now
+        self._last_sent = time.monotonic()
         if requests is None:
             logging.error("Requests library not installed; cannot send alert")
             return
+        if self._session is None:
+            self._session = requests.Session()
         try:
-            requests.post(
+            self._session.post(
                 self.api_url,
                 data={"chat_id": self.chat_id, "text": text},
                 timeout=5,
@@ -51,8 +56,25 @@ class TelegramBot:
         except Exception as exc:  # pragma: no cover - network errors
             logging.error("Telegram send failed: %s", exc)
 
+    def send_batch(self, messages: list[str]) -> None:
+        """Send ``messages`` joined by newlines in as few requests as possible."""
 
-_BOT: Optional[TelegramBot] = None
+        chunk: list[str] = []
+        size = 0
+        for text in messages:
+            text = text[:MAX_MESSAGE_LEN]
+            if chunk and size + 1 + len(text) > MAX_MESSAGE_LEN:
+                self.send_message("\n".join(chunk))
+                chunk, size = [], 0
+            size += len(text) + (1 if chunk else 0)
+            chunk.append(text)
+        if chunk:
+            self.send_message("\n".join(chunk))
+
+
+# ``False`` records that credentials were missing, so disabled alerting does
+# not re-read the environment on every call. Reset to ``None`` to re-check.
+_BOT: TelegramBot | bool | None = None
 
 
 def _get_bot() -> Optional[TelegramBot]:
@@ -60,22 +82,79 @@ def _get_bot() -> Optional[TelegramBot]:
 
     global _BOT
     if _BOT is not None:
-        return _BOT
+        return _BOT or None
 
     token = os.getenv("TELEGRAM_TOKEN", "")
     chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
     if not token or not chat_id:
         logging.debug("Telegram credentials missing; alerts disabled")
+        _BOT = False
         return None
 
     _BOT = TelegramBot(token=token, chat_id=chat_id)
     return _BOT
 
 
+# Alerts are delivered off the caller's thread so a slow or unreachable
+# Telegram API never stalls risk checks or order placement.
+_alert_queue: "queue.Queue[tuple[TelegramBot, str]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _drain_alerts() -> None:
+    while True:
+        bot, message = _alert_queue.get()
+        taken = 1
+        # Alerts arriving while the bot is inside its ``delay`` window are
+        # merged into one message instead of being dropped
+        wait = bot.delay - (time.monotonic() - bot._last_sent)
+        if wait > 0:
+            time.sleep(wait)
+        batches: dict[int, tuple[TelegramBot, list[str]]] = {id(bot): (bot, [message])}
+        while True:
+            try:
+                other, message = _alert_queue.get_nowait()
+            except queue.Empty:
+                break
+            taken += 1
+            batches.setdefault(id(other), (other, []))[1].append(message)
+        try:
+            for target, messages in batches.values():
+                target.send_batch(messages)
+        except Exception as exc:  # pragma: no cover - keep the worker alive
+            logging.error("Alert delivery failed: %s", exc)
+        finally:
+            for _ in range(taken):
+                _alert_queue.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(
+                target=_drain_alerts, name="telegram-alerts", daemon=True
+            )
+            _worker.start()
+
+
 def send_alert(message: str) -> None:
-    """Send a Telegram alert using configuration from ``.env``."""
+    """Queue a Telegram alert using configuration from ``.env``.
+
+    Returns immediately; a background thread performs the HTTP request.
+    """
 
     bot = _get_bot()
     if bot is None:
         return
-    bot.send_message(message)
+    _ensure_worker()
+    _alert_queue.put_nowait((bot, message))
+
+
+def flush_alerts() -> None:
+    """Block until every queued alert has been handed to Telegram."""
+
+    _alert_queue.join()
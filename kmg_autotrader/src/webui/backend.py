@@ -2,39 +2,146 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from dataclasses import asdict
+import math
+import os
+from array import array
+from collections import Counter, deque
+from dataclasses import fields
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator
 
-from fastapi import Body, FastAPI, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+import orjson
+from fastapi import Body, FastAPI, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from src.analysis.performance_analyzer import (
     Trade,
-    compute_metrics,
     compute_db_metrics,
     get_recent_trades,
+    trades_version,
 )
 from src.evaluator.rule_evaluator import Signal
-from src.risk.risk_manager import RiskParameters
+from src.risk.risk_manager import RISK_MODES, RiskParameters
 
 logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+_ENV = Environment(
+    loader=FileSystemLoader(BASE_DIR / "templates"),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    cache_size=-1,
+)
+# The dashboard only varies in its JSON payload, so the template is rendered
+# once around a marker and requests just splice the payload between the halves.
+_PAYLOAD_MARK = "\x00payload\x00"
+_SHELL_TOP, _SHELL_BOTTOM = (
+    part.encode()
+    for part in _ENV.get_template("dashboard.html")
+    .render(payload=_PAYLOAD_MARK)
+    .split(_PAYLOAD_MARK)
+)
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Browsers may reuse static assets for a day before revalidating them.
+STATIC_MAX_AGE = 86400
+STATIC_LOOKUP_CACHE = 512
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets between dashboard loads.
+
+    Starlette already sends ETag/Last-Modified and answers matching
+    conditional requests with 304; this adds an explicit ``Cache-Control`` so
+    refreshes within :data:`STATIC_MAX_AGE` skip the request entirely.
+
+    Resolved paths of existing files are remembered, so repeat requests skip
+    the realpath/stat syscalls. Assets are treated as fixed while the server
+    runs; misses are not cached, so newly added files are still found.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lookups: dict[str, tuple[str, os.stat_result]] = {}
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        hit = self._lookups.get(path)
+        if hit is not None:
+            return hit
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and len(self._lookups) < STATIC_LOOKUP_CACHE:
+            self._lookups[path] = (full_path, stat_result)
+        return full_path, stat_result
 
-app = FastAPI()
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault(
+            "Cache-Control", f"public, max-age={STATIC_MAX_AGE}"
+        )
+        return response
+
+
+app.mount("/static", CachedStaticFiles(directory=BASE_DIR / "static"), name="static")
 
 
 # ---------------------------------------------------------------------------
 # In-memory stores used mainly for tests. Real usage relies on the database.
 # ---------------------------------------------------------------------------
-TRADES: list[Trade] = []
+class TradeStore:
+    """Trades plus column-wise PnL and running equity as packed doubles.
+
+    ``equity`` grows by one entry per append and the win count is kept as a
+    running total, so metrics never have to walk the stored trades.
+    """
+
+    __slots__ = ("_trades", "pnl", "equity", "wins")
+
+    def __init__(self) -> None:
+        self._trades: list[Trade] = []
+        self.pnl = array("d")
+        self.equity = array("d")
+        self.wins = 0
+
+    def append(self, trade: Trade) -> None:
+        pnl = trade.pnl
+        self._trades.append(trade)
+        self.pnl.append(pnl)
+        self.equity.append((self.equity[-1] if self.equity else 0.0) + pnl)
+        self.wins += pnl > 0
+
+    def clear(self) -> None:
+        self._trades.clear()
+        del self.pnl[:]
+        del self.equity[:]
+        self.wins = 0
+
+    @property
+    def total_return(self) -> float:
+        return self.equity[-1] if self.equity else 0.0
+
+    def as_trades(self) -> list[Trade]:
+        """Return the stored Trade objects, e.g. for the dashboard template."""
+
+        return self._trades
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+    def __iter__(self) -> Iterator[Trade]:
+        return iter(self._trades)
+
+
+TRADES = TradeStore()
 ACTIVE_SIGNALS: list[Signal] = []
-REJECTED_SIGNALS: list[tuple[Signal, str]] = []
+# Stored pre-serialized so rendering the dashboard needs no per-request work.
+REJECTED_SIGNALS: list[dict[str, Any]] = []
 RISK_PARAMS = RiskParameters(
     max_position_percent=0.1,
     max_drawdown=5.0,
@@ -42,102 +149,300 @@ RISK_PARAMS = RiskParameters(
     risk_mode="normal",
     min_gpt_trigger_confidence=0.8,
 )
-LOGS: list[str] = []
+# Ring buffer: memory stays bounded however long the bot runs.
+LOGS: deque[str] = deque(maxlen=10_000)
+# Per-endpoint hit counts; polled GETs are counted instead of logged.
+REQUEST_COUNTS: Counter[str] = Counter()
 
 
-@app.get("/", response_class=HTMLResponse)
-def dashboard(request: Request) -> Any:
-    """Render the main dashboard with equity curve and recent activity."""
+def _flat_serializer(cls: type) -> Any:
+    """Build a shallow ``asdict`` replacement for the flat dataclass ``cls``.
+
+    Field names are resolved once and read with a single attrgetter call,
+    skipping asdict's recursive deepcopy of every value.
+    """
+
+    names = tuple(f.name for f in fields(cls))
+    getter = attrgetter(*names)
+    return lambda obj: dict(zip(names, getter(obj)))
+
+
+_signal_to_dict = _flat_serializer(Signal)
+_risk_to_dict = _flat_serializer(RiskParameters)
+_risk_memo: tuple[RiskParameters, dict[str, Any]] | None = None
+
+
+def _risk_dict() -> dict[str, Any]:
+    """Serialized :data:`RISK_PARAMS`, rebuilt only when the object is swapped."""
+
+    global _risk_memo
+    if _risk_memo is None or _risk_memo[0] is not RISK_PARAMS:
+        _risk_memo = (RISK_PARAMS, _risk_to_dict(RISK_PARAMS))
+    return _risk_memo[1]
+
+# Bumped by every mutator above; memoized views and ETags key on it.
+_VERSION = 0
+# Counts add_log() calls; LOGS evicts silently once full, so len() alone
+# cannot tell whether it changed.
+_LOGS_VERSION = 0
+_metrics_memo: tuple[tuple[int, int], dict[str, Any]] | None = None
+_signals_memo: tuple[tuple[int, int], dict[str, Any]] | None = None
+
+
+def _bump() -> None:
+    global _VERSION
+    _VERSION += 1
+
+
+def _etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Return a bodiless 304 when the client already holds ``etag``."""
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def add_trade(trade: Trade) -> None:
+    """Append ``trade`` to :data:`TRADES`, extending its equity curve by one."""
+
+    TRADES.append(trade)
+    _bump()
+
+
+def add_log(entry: str) -> None:
+    """Append ``entry`` to :data:`LOGS`, evicting the oldest when full."""
+
+    global _LOGS_VERSION
+    LOGS.append(entry)
+    _LOGS_VERSION += 1
+
+
+def record_rejection(signal: Signal, reason: str) -> None:
+    """Store a rejected signal for display on the dashboard."""
+
+    REJECTED_SIGNALS.append({"signal": _signal_to_dict(signal), "reason": reason})
+    _bump()
+
+
+# Validators for in-memory GET endpoints, checked before the endpoint runs.
+# /metrics and /signals tag their own responses since their version is only
+# known after the DB-backed trade cache has been refreshed.
+_CONDITIONAL_GET: dict[str, Callable[[], Any]] = {
+    "/risk": lambda: _VERSION,
+    "/logs": lambda: (_LOGS_VERSION, len(LOGS)),
+    "/dashboard.json": lambda: (
+        _VERSION,
+        len(TRADES),
+        len(ACTIVE_SIGNALS),
+        _LOGS_VERSION,
+        len(LOGS),
+    ),
+}
+
+
+@app.middleware("http")
+async def conditional_get(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Answer unchanged polls of in-memory endpoints with a bodiless 304."""
+
+    version = _CONDITIONAL_GET.get(request.url.path)
+    if request.method != "GET" or version is None:
+        return await call_next(request)
+    etag = _etag(request.url.path, request.url.query, version())
+    cached = _not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers["ETag"] = etag
+    return response
+
+
+DASHBOARD_LOG_LINES = 20
+
+
+def _recent_logs(limit: int) -> list[str]:
+    # Walk back from the newest entry so only ``limit`` items are touched
+    entries = list(islice(reversed(LOGS), max(limit, 0)))
+    entries.reverse()
+    return entries
+
+
+def _dashboard_data() -> dict[str, Any]:
+    """Everything the dashboard shows, as one JSON-ready dict."""
 
     metrics = _gather_metrics()
-    context = {
-        "request": request,
-        "equity_curve": metrics["equity_curve"],
-        "trades": TRADES,
-        "rejected_signals": [
-            {"signal": asdict(sig), "reason": reason}
-            for sig, reason in REJECTED_SIGNALS
-        ],
+    return {
+        "metrics": {
+            "total_return": metrics["total_return"],
+            "win_rate": metrics["win_rate"],
+            "trades": metrics["trades"],
+        },
+        "equity": metrics["equity_curve"],
+        "trades": TRADES.pnl.tolist(),
+        "active": [_signal_to_dict(s) for s in ACTIVE_SIGNALS],
+        "rejected": REJECTED_SIGNALS,
+        "risk": _risk_dict(),
+        "logs": _recent_logs(DASHBOARD_LOG_LINES),
     }
-    logger.debug("Rendering dashboard with %d trades", len(TRADES))
-    return templates.TemplateResponse("dashboard.html", context)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def dashboard() -> HTMLResponse:
+    """Render the main dashboard with equity curve and recent activity.
+
+    All rows go to the page as one JSON blob which a small script renders,
+    so the template itself has no per-row loops.
+    """
+
+    payload = orjson.dumps(_dashboard_data())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Rendering dashboard with %d trades", len(TRADES))
+    # Escape "<" so no string in the payload can close the <script> block
+    body = b"".join((_SHELL_TOP, payload.replace(b"<", b"\\u003c"), _SHELL_BOTTOM))
+    return HTMLResponse(body)
+
+
+@app.get("/dashboard.json", response_class=ORJSONResponse)
+async def dashboard_json() -> Response:
+    """Return the whole dashboard state so the page polls a single endpoint."""
+
+    REQUEST_COUNTS["/dashboard.json"] += 1
+    # max-age=1 lets the browser coalesce overlapping polls from open tabs
+    return ORJSONResponse(
+        _dashboard_data(), headers={"Cache-Control": "private, max-age=1"}
+    )
 
 
 def _gather_metrics() -> dict[str, Any]:
-    """Helper to compute metrics from stored trades."""
-
-    metrics = compute_metrics(TRADES)
-    equity: list[float] = []
-    cumulative = 0.0
-    for trade in TRADES:
-        cumulative += trade.pnl
-        equity.append(cumulative)
-    metrics["equity_curve"] = equity
-    logger.debug("Metrics computed: %s", metrics)
+    """Compose metrics from the running totals of :data:`TRADES`.
+
+    Memoized per version so repeated renders share one equity list copy.
+    """
+
+    global _metrics_memo
+    # len(TRADES) also catches trades appended without add_trade()
+    key = (_VERSION, len(TRADES))
+    if _metrics_memo is not None and _metrics_memo[0] == key:
+        return _metrics_memo[1]
+    count = len(TRADES)
+    metrics = {
+        "total_return": TRADES.total_return,
+        "win_rate": TRADES.wins / count if count else 0.0,
+        "trades": count,
+        "equity_curve": TRADES.equity.tolist(),
+    }
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Metrics computed: %s", metrics)
+    _metrics_memo = (key, metrics)
     return metrics
 
 
-@app.get("/metrics")
-def metrics() -> dict[str, Any]:
-    """Return PnL statistics from the database."""
+@app.get("/metrics", response_class=ORJSONResponse)
+def metrics(request: Request) -> Response:
+    """Return PnL statistics from the database.
+
+    Kept synchronous (run in the threadpool) because a stale trade cache is
+    refreshed with a blocking SQLAlchemy query; the same holds for /signals.
+    """
 
-    logger.info("/metrics requested")
-    return compute_db_metrics()
+    REQUEST_COUNTS["/metrics"] += 1
+    data = compute_db_metrics()  # memoized on the trade cache version
+    etag = _etag("metrics", trades_version())
+    return _not_modified(request, etag) or ORJSONResponse(
+        data, headers={"ETag": etag}
+    )
 
 
-@app.get("/signals")
-def signals(limit: int = 20) -> dict[str, Any]:
+@app.get("/signals", response_class=ORJSONResponse)
+def signals(request: Request, limit: int = 20) -> Response:
     """Return last N trading signals and their status."""
 
-    logger.info("/signals requested limit=%d", limit)
+    global _signals_memo
+    REQUEST_COUNTS["/signals"] += 1
     trades = get_recent_trades(limit)
-    return {
-        "signals": [
-            {
-                "timestamp": t.timestamp.isoformat(),
-                "symbol": t.symbol,
-                "side": t.side,
-                "status": t.status,
-            }
-            for t in trades[::-1]
-        ]
-    }
+    key = (trades_version(), limit)
+    etag = _etag("signals", *key)
+    cached = _not_modified(request, etag)
+    if cached is not None:
+        return cached
+    if _signals_memo is None or _signals_memo[0] != key:
+        payload = {
+            "signals": [
+                {
+                    "timestamp": t.timestamp,
+                    "symbol": t.symbol,
+                    "side": t.side,
+                    "status": t.status,
+                }
+                for t in reversed(trades)
+            ]
+        }
+        _signals_memo = (key, payload)
+    # Returned as a response object so FastAPI skips jsonable_encoder and
+    # orjson formats the datetimes natively.
+    return ORJSONResponse(_signals_memo[1], headers={"ETag": etag})
 
 
 @app.get("/risk")
-def get_risk() -> dict[str, float]:
+async def get_risk() -> dict[str, Any]:
     """Return current risk management parameters."""
 
-    logger.info("/risk GET requested")
-    return asdict(RISK_PARAMS)
+    REQUEST_COUNTS["/risk"] += 1
+    return _risk_dict()
 
 
-class RiskModel(BaseModel):
-    """Pydantic model for editing risk parameters."""
+_RISK_FLOATS = (
+    "max_position_percent",
+    "max_drawdown",
+    "min_confidence",
+    "min_gpt_trigger_confidence",
+)
+
 
-    max_position_percent: float
-    max_drawdown: float
-    min_confidence: float
-    risk_mode: str
-    min_gpt_trigger_confidence: float
+def _risk_float(key: str, value: Any) -> float:
+    # float() would take True as 1.0 and "nan"/"inf" as non-finite numbers
+    if isinstance(value, bool):
+        raise ValueError(f"{key} must be a number, got {value!r}")
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{key} must be finite, got {value!r}")
+    return number
 
 
 @app.put("/risk")
-def update_risk(params: RiskModel = Body(...)) -> dict[str, float]:
+async def update_risk(params: dict[str, Any] = Body(...)) -> dict[str, Any]:
     """Update risk management parameters."""
 
     logger.info("/risk PUT requested: %s", params)
-    RISK_PARAMS.max_position_percent = params.max_position_percent
-    RISK_PARAMS.max_drawdown = params.max_drawdown
-    RISK_PARAMS.min_confidence = params.min_confidence
-    RISK_PARAMS.risk_mode = params.risk_mode
-    RISK_PARAMS.min_gpt_trigger_confidence = params.min_gpt_trigger_confidence
-    return asdict(RISK_PARAMS)
+    try:
+        # Validate everything before assigning so a bad body changes nothing
+        values = {key: _risk_float(key, params[key]) for key in _RISK_FLOATS}
+        risk_mode = params["risk_mode"]
+        if not isinstance(risk_mode, str) or risk_mode not in RISK_MODES:
+            raise ValueError(
+                f"risk_mode must be one of {sorted(RISK_MODES)}, got {risk_mode!r}"
+            )
+    except KeyError as exc:
+        raise HTTPException(status_code=422, detail=f"Missing field: {exc.args[0]}")
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    global RISK_PARAMS
+    # A single rebind: concurrent readers see either the old or the new set
+    RISK_PARAMS = RiskParameters(**values, risk_mode=risk_mode)
+    _bump()
+    return _risk_dict()
 
 
 @app.get("/logs")
-def logs(limit: int = 20) -> dict[str, list[str]]:
+async def logs(limit: int = 20) -> dict[str, list[str]]:
     """Return last GPT actions and trade logs."""
 
-    logger.info("/logs requested, limit=%d", limit)
-    return {"entries": LOGS[-limit:]}
+    REQUEST_COUNTS["/logs"] += 1
+    return {"entries": _recent_logs(limit)}
@@ -0,0 +1,125 @@
+"""Tests for the FastAPI web backend."""
+
+from collections import deque
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("jinja2")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.evaluator.rule_evaluator import Signal
+from src.webui import backend
+
+client = TestClient(backend.app)
+
+_VALID_RISK = {
+    "max_position_percent": 0.2,
+    "max_drawdown": 4.0,
+    "min_confidence": 0.6,
+    "risk_mode": "conservative",
+    "min_gpt_trigger_confidence": 0.7,
+}
+
+
+@pytest.fixture(autouse=True)
+def _restore_risk(monkeypatch):
+    # update_risk rebinds the module global; put the original back afterwards
+    monkeypatch.setattr(backend, "RISK_PARAMS", backend.RISK_PARAMS)
+
+
+def test_get_risk():
+    response = client.get("/risk")
+
+    assert response.status_code == 200
+    assert response.json()["risk_mode"] == backend.RISK_PARAMS.risk_mode
+
+
+def test_put_risk_applies_change():
+    response = client.put("/risk", json=_VALID_RISK)
+
+    assert response.status_code == 200
+    assert response.json() == _VALID_RISK
+    assert backend.RISK_PARAMS.risk_mode == "conservative"
+    assert client.get("/risk").json() == _VALID_RISK
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("max_drawdown", True),
+        ("min_confidence", "nan"),
+        ("max_position_percent", "inf"),
+        ("risk_mode", 1),
+    ],
+)
+def test_put_risk_rejects_invalid_values(field, value):
+    before = backend.RISK_PARAMS
+
+    response = client.put("/risk", json={**_VALID_RISK, field: value})
+
+    assert response.status_code == 422
+    assert backend.RISK_PARAMS is before
+
+
+@pytest.fixture
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(backend, "TRADES", backend.TradeStore())
+    monkeypatch.setattr(backend, "REJECTED_SIGNALS", [])
+    monkeypatch.setattr(backend, "LOGS", deque(maxlen=10))
+
+
+@pytest.mark.parametrize("path", ["/risk", "/logs", "/dashboard.json"])
+def test_conditional_get_returns_304(fresh_state, path):
+    first = client.get(path)
+    etag = first.headers["ETag"]
+
+    second = client.get(path, headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_etag_changes_after_trade_and_log(fresh_state):
+    etag = client.get("/dashboard.json").headers["ETag"]
+
+    backend.add_trade(backend.Trade(pnl=1.5))
+    after_trade = client.get("/dashboard.json", headers={"If-None-Match": etag})
+    assert after_trade.status_code == 200
+    assert after_trade.json()["equity"] == [1.5]
+
+    logs_etag = client.get("/logs").headers["ETag"]
+    backend.add_log("order filled")
+    after_log = client.get("/logs", headers={"If-None-Match": logs_etag})
+    assert after_log.status_code == 200
+    assert after_log.json() == {"entries": ["order filled"]}
+
+
+def test_dashboard_payload_escapes_script_end(fresh_state):
+    signal = Signal("BTC", "BUY", "rule", "rule")
+    backend.record_rejection(signal, "</script><b>x</b>")
+
+    body = client.get("/").text
+
+    assert "</script><b>" not in body
+    assert "\\u003c/script>\\u003cb>" in body
+
+
+def test_static_files_are_cacheable(tmp_path):
+    (tmp_path / "app.js").write_text("console.log(1);")
+    app = FastAPI()
+    app.mount("/static", backend.CachedStaticFiles(directory=tmp_path))
+    static_client = TestClient(app)
+
+    first = static_client.get("/static/app.js")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == f"public, max-age={backend.STATIC_MAX_AGE}"
+
+    again = static_client.get(
+        "/static/app.js", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert again.status_code == 304
@@ -3,9 +3,11 @@
 import asyncio
 from unittest import mock
 
+import asyncpg
 import pytest
 
-from src.collector.binance_data_collector import BinanceDataCollector
+from src.collector import binance_data_collector
+from src.collector.binance_data_collector import BinanceDataCollector, _kline_fields
 
 
 @pytest.mark.asyncio
@@ -19,3 +21,166 @@ async def test_collect(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(collector, "_start_ws", dummy)
 
     await collector.collect()
+
+
+@pytest.mark.asyncio
+async def test_failed_backfill_stops_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    collector = BinanceDataCollector()
+    cancelled = asyncio.Event()
+
+    async def failing_backfill():
+        raise RuntimeError("backfill failed")
+
+    async def stream():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    monkeypatch.setattr(collector, "_fetch_historical", failing_backfill)
+    monkeypatch.setattr(collector, "_start_ws", stream)
+
+    with pytest.raises(ExceptionGroup):
+        await collector.collect()
+    assert cancelled.is_set()
+
+
+class _FakeStream:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            raise StopAsyncIteration
+        return self._messages.pop(0)
+
+
+def _kline(t: int) -> dict:
+    return {"k": {"t": t, "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": "10", "T": t + 59}}
+
+
+@pytest.mark.asyncio
+async def test_ws_candles_are_copied_in_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    collector = BinanceDataCollector()
+    collector._client = mock.Mock()
+    collector._pool = asyncpg.Pool()
+    copied = []
+
+    async def fake_copy(table, records, columns):
+        copied.append((table, list(records)))
+
+    monkeypatch.setattr(collector._pool._conn, "copy_records_to_table", fake_copy)
+    monkeypatch.setattr(binance_data_collector, "FLUSH_SIZE", 2)
+    monkeypatch.setattr(binance_data_collector, "FLUSH_INTERVAL", 3600.0)
+    monkeypatch.setattr(
+        binance_data_collector,
+        "BinanceSocketManager",
+        lambda client: mock.Mock(
+            kline_socket=lambda *a, **k: _FakeStream(_kline(t) for t in range(3))
+        ),
+    )
+
+    await collector._start_ws()
+
+    assert [len(records) for _, records in copied] == [2, 1]
+    assert copied[0][0] == "market_data_stage"
+    assert copied[0][1][0] == (0, 1.0, 2.0, 0.5, 1.5, 10.0, 59)
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_candles(monkeypatch: pytest.MonkeyPatch) -> None:
+    collector = BinanceDataCollector()
+    collector._pool = asyncpg.Pool()
+
+    async def failing_copy(table, records, columns):
+        raise asyncpg.PostgresError("connection lost")
+
+    monkeypatch.setattr(collector._pool._conn, "copy_records_to_table", failing_copy)
+    collector._buf.extend(_kline_fields(_kline(t)["k"]) for t in range(2))
+
+    await collector._flush()
+
+    assert [row[0] for row in collector._buf] == [0, 1]
+
+
+def test_requeue_drops_oldest_beyond_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(binance_data_collector, "MAX_BUFFERED", 3)
+    collector = BinanceDataCollector()
+    collector._buf.extend(_kline_fields(_kline(t)["k"]) for t in (3, 4))
+
+    collector._requeue([_kline_fields(_kline(t)["k"]) for t in (0, 1, 2)])
+
+    assert [row[0] for row in collector._buf] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_sends_column_arrays(monkeypatch: pytest.MonkeyPatch) -> None:
+    collector = BinanceDataCollector()
+    collector._pool = asyncpg.Pool()
+    statements = []
+    calls = []
+
+    async def fake_executemany(sql, args):
+        statements.append(sql)
+        calls.extend(args)
+
+    monkeypatch.setattr(collector._pool._conn, "executemany", fake_executemany)
+    monkeypatch.setattr(binance_data_collector, "BULK_CHUNK", 2)
+    klines = [[t, "1", "2", "0.5", "1.5", "10", t + 59, "x"] for t in range(3)]
+
+    await collector._bulk_insert(klines)
+
+    assert statements == [binance_data_collector._INSERT_UNNEST]
+    assert len(calls) == 2
+    assert calls[0][0] == [0, 1] and calls[0][6] == [59, 60]
+    assert calls[1][1] == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_after_backfilled_candle(monkeypatch: pytest.MonkeyPatch) -> None:
+    collector = BinanceDataCollector()
+    collector._pool = asyncpg.Pool()
+    collector._client = mock.Mock()
+    starts = []
+    marks = []
+
+    async def fake_fetchval(sql, symbol):
+        assert "market_data_backfill" in sql
+        return 1_000
+
+    async def fake_execute(sql, *args):
+        marks.append(args[1])
+
+    async def klines():
+        for t in range(5):
+            yield [1_001 + t, "1", "2", "0.5", "1.5", "10", 1_060 + t]
+
+    async def fake_klines(symbol, interval, start):
+        starts.append(start)
+        return klines()
+
+    async def fake_bulk_insert(klines):
+        batches.append(len(klines))
+
+    batches = []
+    monkeypatch.setattr(collector._pool, "fetchval", fake_fetchval)
+    monkeypatch.setattr(collector._pool, "execute", fake_execute)
+    monkeypatch.setattr(collector, "_bulk_insert", fake_bulk_insert)
+    monkeypatch.setattr(binance_data_collector, "BULK_CHUNK", 2)
+    collector._client.get_historical_klines_generator = fake_klines
+
+    await collector._fetch_historical()
+
+    assert starts == [1_001]
+    assert batches == [2, 2, 1]
+    assert marks == [1_002, 1_004, 1_005]
@@ -1,6 +1,9 @@
 from unittest import mock
 """Tests for trade executor using mocked Binance API."""
 
+import sqlite3
+import time
+
 import pytest
 
 from src.executor.executor import Executor
@@ -36,6 +39,18 @@ def test_successful_trade(monkeypatch: pytest.MonkeyPatch) -> None:
     assert rows == 1
 
 
+def test_repeated_prompt_is_not_reexecuted(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = mock.Mock()
+    client.get_position.return_value = 0.0
+    client.place_order.return_value = {"price": "100"}
+    executor = setup_executor(monkeypatch, client)
+
+    assert executor.execute("prompt", "BTCUSDT")
+    assert not executor.execute("prompt", "BTCUSDT")
+    assert executor._gpt.send_prompt.call_count == 1
+    client.place_order.assert_called_once()
+
+
 def test_execution_error(monkeypatch: pytest.MonkeyPatch) -> None:
     client = mock.Mock()
     client.get_position.return_value = 0.0
@@ -59,3 +74,79 @@ def test_position_limit_reject(monkeypatch: pytest.MonkeyPatch) -> None:
     client.place_order.assert_not_called()
     rows = executor._conn.execute("SELECT status FROM TradeLog").fetchall()
     assert rows[0][0] == "rejected"
+
+
+def _api_error(code: int) -> BinanceAPIException:
+    exc = BinanceAPIException("error")
+    exc.code = code
+    return exc
+
+
+def test_retry_on_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = mock.Mock()
+    client.get_position.return_value = 0.0
+    client.place_order.side_effect = [_api_error(-1003), {"price": "100"}]
+    executor = setup_executor(monkeypatch, client)
+    monkeypatch.setattr("src.executor.executor.time.sleep", lambda s: None)
+
+    assert executor.execute("prompt", "BTCUSDT")
+    assert client.place_order.call_count == 2
+
+
+def test_no_retry_when_order_status_unknown(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = mock.Mock()
+    client.get_position.return_value = 0.0
+    client.place_order.side_effect = _api_error(-1007)
+    executor = setup_executor(monkeypatch, client)
+
+    assert not executor.execute("prompt", "BTCUSDT")
+    client.place_order.assert_called_once()
+
+
+def test_no_retry_on_insufficient_balance(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = mock.Mock()
+    client.get_position.return_value = 0.0
+    client.place_order.side_effect = _api_error(-2010)
+    executor = setup_executor(monkeypatch, client)
+
+    assert not executor.execute("prompt", "BTCUSDT")
+    client.place_order.assert_called_once()
+
+
+def test_legacy_log_gains_ts_ms(tmp_path) -> None:
+    db = tmp_path / "trade_log.db"
+    conn = sqlite3.connect(db)
+    conn.execute(
+        "CREATE TABLE TradeLog(id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT,"
+        " symbol TEXT, side TEXT, quantity REAL, price REAL, status TEXT)"
+    )
+    conn.close()
+
+    executor = Executor(client=mock.Mock(), gpt=mock.Mock(), db_path=str(db), position_limit=0.2)
+    executor._log_trade("BTCUSDT", "BUY", 0.1, 100.0, "filled")
+
+    ts_ms = executor._conn.execute("SELECT ts_ms FROM TradeLog").fetchone()[0]
+    assert isinstance(ts_ms, int) and ts_ms > 1_600_000_000_000
+    executor.close()
+
+
+def test_deferred_log_is_committed_by_timer(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr("src.executor.executor.COMMIT_INTERVAL", 0.05)
+    db = tmp_path / "trade_log.db"
+    executor = Executor(client=mock.Mock(), gpt=mock.Mock(), db_path=str(db), position_limit=0.2)
+    executor._last_commit = time.monotonic()
+    executor._log_trade("BTCUSDT", "BUY", 0.1, 0.0, "rejected", defer=True)
+
+    reader = sqlite3.connect(db)
+    assert reader.execute("SELECT COUNT(*) FROM TradeLog").fetchone()[0] == 0
+    time.sleep(0.2)
+    assert reader.execute("SELECT COUNT(*) FROM TradeLog").fetchone()[0] == 1
+    reader.close()
+    executor.close()
+
+
+def test_deferred_commit_after_close_is_noop(tmp_path) -> None:
+    executor = Executor(client=mock.Mock(), gpt=mock.Mock(), db_path=str(tmp_path / "t.db"), position_limit=0.2)
+    executor.close()
+
+    executor._commit_deferred()  # a timer that fired while close() held the lock
@@ -1,16 +1,24 @@
 """Tests for GPT controller and trigger validation."""
 
+import asyncio
 from typing import List
+from unittest import mock
 
 import pytest
 
 from src.collector.binance_data_collector import Candle
 from src.evaluator.rule_evaluator import Signal
 from src.risk.risk_manager import RiskManager, RiskParameters
-from src.trigger.gpt_controller import GPTController
+from src.trigger.gpt_controller import GPTController, GPTResponse
 from src.trigger.gpt_trigger import GPTTrigger
 
 
+@pytest.fixture(autouse=True)
+def _isolated_log_db(monkeypatch, tmp_path):
+    # Keep GPT log rows out of the tracked project_metadata database
+    monkeypatch.setattr("src.trigger.gpt_controller.DB_PATH", tmp_path / "gpt_log.db")
+
+
 class DummyExecutor:
     def __init__(self) -> None:
         self.orders = []
@@ -131,3 +139,49 @@ async def test_schema_fallback(monkeypatch) -> None:
     result = await trigger.process(signal, candles, 0.0)
     assert not result
     assert called["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_refusals_are_batched() -> None:
+    controller = mock.Mock()
+    risk = RiskManager(RiskParameters(1.0, 10.0))
+    trigger = GPTTrigger(controller, risk, DummyExecutor(), max_per_hour=5)
+
+    for reason in ("a", "b", "c"):
+        trigger._log_refusal(reason)
+    await asyncio.sleep(0.2)
+
+    controller.log_many.assert_called_once_with(
+        [("", "", 0, "a"), ("", "", 0, "b"), ("", "", 0, "c")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_allow_refills_over_time() -> None:
+    risk = RiskManager(RiskParameters(1.0, 10.0))
+    trigger = GPTTrigger(mock.Mock(), risk, DummyExecutor(), max_per_hour=2)
+
+    assert await trigger.allow()
+    assert await trigger.allow()
+    assert not await trigger.allow()
+
+    trigger._last_refill -= 1800  # half an hour refills one call
+    assert await trigger.allow()
+    assert not await trigger.allow()
+
+
+@pytest.mark.asyncio
+async def test_confidence_uses_params_swapped_during_request() -> None:
+    risk = RiskManager(RiskParameters(1.0, 10.0))
+
+    async def decide(candles, position, params):
+        risk._set_conservative()  # raises min_confidence to 0.9 mid-request
+        return GPTResponse("BUY", 0.5, 1.0, 2.0, 0.85)
+
+    executor = DummyExecutor()
+    controller = mock.Mock(request_decision_async=decide)
+    trigger = GPTTrigger(controller, risk, executor, max_per_hour=5)
+    signal = Signal("BTC", "BUY", "reason", "rule")
+
+    assert not await trigger.process(signal, [Candle(0, 0, 0, 0, 0, 0, 0)], 0.0)
+    assert executor.orders == []
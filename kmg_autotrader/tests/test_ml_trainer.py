@@ -40,3 +40,33 @@ def test_train(tmp_path: Path) -> None:
         clf = pickle.load(f)
     preds = clf.predict(features)
     assert len(preds) == len(labels)
+
+
+def test_rsi_wilder_smoothing() -> None:
+    # Seed of two deltas (+1, -1), then Wilder updates with period 2
+    rsi = ml_trainer._rsi([10.0, 11.0, 10.0, 12.0], period=2)
+    assert rsi[:3] == [50.0, 100.0, 50.0]
+    avg_gain, avg_loss = (0.5 + 2) / 2, 0.5 / 2
+    assert rsi[3] == 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def test_train_skips_unchanged_data(tmp_path: Path) -> None:
+    db = tmp_path / "trades.db"
+    _create_db(db)
+    model_path = tmp_path / "model.pkl"
+
+    ml_trainer.DB_PATH = db
+    ml_trainer.MODEL_PATH = model_path
+
+    ml_trainer.train()
+    model_path.write_bytes(b"sentinel")
+
+    ml_trainer.train()
+    assert model_path.read_bytes() == b"sentinel"
+
+    conn = sqlite3.connect(db)
+    conn.execute("INSERT INTO trade_log VALUES (1, 2, 0, 1, 1.0)")
+    conn.commit()
+    conn.close()
+    ml_trainer.train()
+    assert model_path.read_bytes() != b"sentinel"
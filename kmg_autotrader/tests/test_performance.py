@@ -1,6 +1,12 @@
 """Performance analyzer tests."""
 
-from src.analysis.performance_analyzer import Trade, compute_metrics
+from src.analysis.performance_analyzer import (
+    Trade,
+    compute_metrics,
+    equity_and_drawdown,
+    max_drawdown,
+    pnl_equity,
+)
 
 
 def test_metrics():
@@ -9,3 +15,10 @@ def test_metrics():
     assert metrics["total_return"] == 2
     assert metrics["trades"] == 3
     assert metrics["win_rate"] == 2 / 3
+
+
+def test_equity_and_drawdown():
+    trades = [Trade(pnl=1), Trade(pnl=-2), Trade(pnl=3), Trade(pnl=-5), Trade(pnl=2)]
+    equity, drawdown = equity_and_drawdown(trades)
+    assert equity == pnl_equity(trades) == [1, -1, 2, -3, -1]
+    assert drawdown == max_drawdown(equity) == 5
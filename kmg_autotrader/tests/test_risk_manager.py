@@ -1,7 +1,12 @@
 """Tests for RiskManager."""
 
+import pickle
+from unittest import mock
+
+from src.risk import risk_manager
 from src.risk.risk_manager import RiskManager, RiskParameters
 from src.analysis import performance_analyzer
+from src.analysis.ml_trainer import SimpleModel
 
 
 def test_validate():
@@ -32,3 +37,19 @@ def test_auto_adjust(monkeypatch):
     assert manager._params.risk_mode == "conservative"
     assert manager._volume_factor == 0.5
     assert manager._params.min_confidence >= 0.9
+
+
+def test_model_loaded_once(monkeypatch, tmp_path):
+    model_path = tmp_path / "model.pkl"
+    model = SimpleModel()
+    model.fit([[1.0], [0.0]], [1, 0])
+    model_path.write_bytes(pickle.dumps(model))
+    monkeypatch.setattr(risk_manager, "ML_MODEL_PATH", model_path)
+    load = mock.Mock(wraps=pickle.load)
+    monkeypatch.setattr(risk_manager.pickle, "load", load)
+
+    manager = RiskManager(RiskParameters(max_position_percent=1.0, max_drawdown=10))
+    assert manager.validate(0.1, ask_model=True, features=[1.0])
+    assert manager.validate(0.1, ask_model=True, features=[0.9])
+
+    assert load.call_count == 1
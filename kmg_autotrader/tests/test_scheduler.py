@@ -2,6 +2,7 @@ import threading
 import time
 from unittest import mock
 
+from src import scheduler as scheduler_module
 from src.scheduler import Scheduler
 
 
@@ -45,3 +46,44 @@ def test_no_duplicate_runs():
     t.join()
 
     assert gt.check_new_signals.call_count == 1
+
+
+def test_failing_job_is_rescheduled(monkeypatch):
+    scheduler = Scheduler(mock.Mock(), mock.Mock(), mock.Mock())
+    entered = []
+
+    def fake_enter(delay, priority, action, argument=(), kwargs=None):
+        entered.append(delay)
+
+    monkeypatch.setattr(scheduler._sched, "enter", fake_enter)
+    job = mock.Mock(side_effect=RuntimeError("boom"), __name__="job")
+
+    scheduler._wrap(job, 7)()
+
+    assert entered == [7]
+
+
+def test_offloaded_job_reschedules_after_completion(monkeypatch):
+    scheduler = Scheduler(mock.Mock(), mock.Mock(), mock.Mock())
+    done = threading.Event()
+
+    def fake_enter(delay, priority, action, argument=(), kwargs=None):
+        done.set()
+
+    monkeypatch.setattr(scheduler._sched, "enter", fake_enter)
+    wrapped = scheduler._wrap(time.time, 5, offload=True)
+
+    wrapped()
+    assert done.wait(10)
+    scheduler_module._shutdown_process_pool()
+
+
+def test_stop_wakes_idle_scheduler():
+    scheduler = Scheduler(mock.Mock(), mock.Mock(), mock.Mock())
+    scheduler.start()
+
+    started = time.monotonic()
+    scheduler.stop()
+
+    assert not scheduler._thread.is_alive()
+    assert time.monotonic() - started < 1
@@ -1,4 +1,6 @@
 import builtins
+import threading
+import time
 from unittest import mock
 
 import pytest
@@ -16,10 +18,11 @@ def test_send_alert(monkeypatch):
 
     monkeypatch.setenv('TELEGRAM_TOKEN', 'token')
     monkeypatch.setenv('TELEGRAM_CHAT_ID', '123')
-    monkeypatch.setattr(telegram_bot, 'requests', mock.Mock(post=fake_post))
+    monkeypatch.setattr(telegram_bot, 'requests', mock.Mock(Session=lambda: mock.Mock(post=fake_post)))
     telegram_bot._BOT = None
 
     telegram_bot.send_alert('hello')
+    telegram_bot.flush_alerts()
 
     assert 'bottoken' in calls['url']
     assert calls['data']['chat_id'] == '123'
@@ -27,19 +30,51 @@ def test_send_alert(monkeypatch):
 
 
 def test_rate_limit(monkeypatch):
-    send_count = 0
+    texts = []
 
     def fake_post(url, data=None, timeout=None):
-        nonlocal send_count
-        send_count += 1
+        texts.append(data['text'])
+        return mock.Mock(status_code=200)
+
+    monkeypatch.setattr(telegram_bot, 'requests', mock.Mock(Session=lambda: mock.Mock(post=fake_post)))
+    telegram_bot._BOT = telegram_bot.TelegramBot(
+        token='token', chat_id='123', delay=0.2, _last_sent=time.monotonic()
+    )
+
+    telegram_bot.send_alert('one')
+    telegram_bot.send_alert('two')
+    telegram_bot.flush_alerts()
+
+    assert texts == ['one\ntwo']
+
+
+def test_send_batch_splits_long_messages(monkeypatch):
+    bot = telegram_bot.TelegramBot(token='token', chat_id='123')
+    sent = []
+    monkeypatch.setattr(telegram_bot.TelegramBot, 'send_message', lambda self, text: sent.append(text))
+
+    bot.send_batch(['a' * 3000, 'b' * 3000, 'c'])
+
+    assert sent == ['a' * 3000, 'b' * 3000 + '\nc']
+
+
+def test_send_alert_does_not_block(monkeypatch):
+    release = threading.Event()
+    sent = []
+
+    def fake_post(url, data=None, timeout=None):
+        release.wait(5)
+        sent.append(data['text'])
         return mock.Mock(status_code=200)
 
     monkeypatch.setenv('TELEGRAM_TOKEN', 'token')
     monkeypatch.setenv('TELEGRAM_CHAT_ID', '123')
-    monkeypatch.setattr(telegram_bot, 'requests', mock.Mock(post=fake_post))
+    monkeypatch.setattr(telegram_bot, 'requests', mock.Mock(Session=lambda: mock.Mock(post=fake_post)))
     telegram_bot._BOT = None
 
-    telegram_bot.send_alert('one')
-    telegram_bot.send_alert('two')
+    telegram_bot.send_alert('slow')
+    assert sent == []
 
-    assert send_count == 1
+    release.set()
+    telegram_bot.flush_alerts()
+    assert sent == ['slow']